@@ -0,0 +1,5 @@
+import sys
+
+from five_sigma.cli import main
+
+sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Single console entry point for the problems.
+
+Only the standard library is imported up front, each subcommand imports the
+module that does the work (and with it rich, typer, pandas, ...) once it has
+been picked, so a scheduler calling one problem never pays for the others or
+for parsing the command line with a heavy framework
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+
+class Subcommand(NamedTuple):
+    """
+    Where a subcommand's implementation lives and how to call it, resolved
+    lazily so describing the command never imports it
+    """
+
+    module: str
+    function: str
+    help: str
+    add_arguments: Callable[[argparse.ArgumentParser], None]
+    arguments: Callable[[argparse.Namespace], Dict[str, Any]]
+
+
+def _concert_arguments(parser: argparse.ArgumentParser) -> None:
+    # Left unset the problem's own defaults apply
+    parser.add_argument("--size", type=int, default=None)
+    parser.add_argument("--simulations", type=int, default=None)
+    _experiment_arguments(parser)
+
+
+def _experiment_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Master seed to replay a run"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes to use"
+    )
+
+
+def _garden_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("path", type=Path)
+    parser.add_argument("generations", type=int, nargs="?", default=10)
+    parser.add_argument(
+        "--butterflies",
+        action="store_true",
+        help="Enable butterflies in the simulation",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Master seed to replay a run"
+    )
+
+
+def _steady_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--butterflies",
+        action="store_true",
+        help="Enable butterflies in the simulation",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Master seed to replay a run"
+    )
+
+
+def _replica_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("path", type=Path)
+    parser.add_argument("replicas", type=int, nargs="?", default=100)
+    _experiment_arguments(parser)
+
+
+def _stratify_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Aggregate a CSV tape chunk by chunk",
+    )
+    parser.add_argument("--chunksize", type=int, default=None)
+    parser.add_argument("--export-dir", type=Path, default=None)
+    parser.add_argument(
+        "--export-format", choices=("csv", "json", "html"), default="csv"
+    )
+    parser.add_argument("--show-memory", action="store_true")
+    parser.add_argument(
+        "--sqlite",
+        type=Path,
+        default=None,
+        help="Answer the tables from a SQLite copy of the tape",
+    )
+
+
+SUBCOMMANDS: Dict[str, Subcommand] = {
+    "concerts": Subcommand(
+        "problem_a.main",
+        "simulate_concerts",
+        "Monte carlo the concert seating problem",
+        _concert_arguments,
+        lambda args: {
+            name: value
+            for name, value in (
+                ("size", args.size),
+                ("simulations", args.simulations),
+            )
+            if value is not None
+        }
+        | {"seed": args.seed, "max_workers": args.workers},
+    ),
+    "garden": Subcommand(
+        "problem_b.main",
+        "simulate_garden",
+        "Simulate a garden for a number of generations",
+        _garden_arguments,
+        lambda args: {
+            "file_path": str(args.path),
+            "generations": args.generations,
+            "butterflies": args.butterflies,
+            "seed": args.seed,
+        },
+    ),
+    "steady": Subcommand(
+        "problem_b.main",
+        "simulate_till_steady",
+        "Simulate a garden until it reaches a steady state",
+        _steady_arguments,
+        lambda args: {
+            "file_path": str(args.path),
+            "butterflies": args.butterflies,
+            "seed": args.seed,
+        },
+    ),
+    "replicas": Subcommand(
+        "problem_b.main",
+        "simulate_replicas",
+        "Simulate many seeded butterfly gardens until steady",
+        _replica_arguments,
+        lambda args: {
+            "file_path": str(args.path),
+            "replicas": args.replicas,
+            "seed": args.seed,
+            "workers": args.workers,
+        },
+    ),
+    "stratify": Subcommand(
+        "problem_c.main",
+        "problem_c",
+        "Print the stratification tables of a loan tape",
+        _stratify_arguments,
+        lambda args: {
+            "path": args.path,
+            "stream": args.stream,
+            "chunksize": args.chunksize,
+            "export_dir": args.export_dir,
+            "export_format": args.export_format,
+            "show_memory": args.show_memory,
+            "sqlite_path": args.sqlite,
+        },
+    ),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="five-sigma")
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report the time spent importing and computing on stderr",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, subcommand in SUBCOMMANDS.items():
+        subcommand.add_arguments(
+            subparsers.add_parser(name, help=subcommand.help)
+        )
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    subcommand = SUBCOMMANDS[args.command]
+
+    start = time.perf_counter()
+    function = getattr(
+        importlib.import_module(subcommand.module), subcommand.function
+    )
+    imported = time.perf_counter()
+    function(**subcommand.arguments(args))
+    finished = time.perf_counter()
+
+    if args.timings:
+        print(
+            f"{args.command}: import {imported - start:.3f}s, "
+            f"compute {finished - imported:.3f}s",
+            file=sys.stderr,
+        )
+
+    return 0
@@ -0,0 +1,54 @@
+import pytest
+import subprocess
+import sys
+
+from pathlib import Path
+
+from five_sigma.cli import main
+
+EXAMPLE_PATH = (
+    Path(__file__).parents[1] / "problem_b" / "input" / "example_1.txt"
+)
+
+
+def test_parser__imports_no_subcommand() -> None:
+    heavy = ("rich", "typer", "pandas", "problem_a", "problem_b", "problem_c")
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from five_sigma.cli import build_parser; "
+            "build_parser().parse_args(['steady', 'garden.txt']); "
+            f"print([name for name in {heavy!r} if name in sys.modules])",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_main__timings(capsys) -> None:
+    assert main(["--timings", "steady", str(EXAMPLE_PATH)]) == 0
+
+    captured = capsys.readouterr()
+    assert "Steady state found" in captured.out
+    assert captured.err.startswith("steady: import ")
+    assert "compute" in captured.err
+
+
+def test_main__no_replicas() -> None:
+    with pytest.raises(ValueError):
+        main(["replicas", str(EXAMPLE_PATH), "0"])
+
+
+def test_main__seeded_butterflies_replay(capsys) -> None:
+    outputs = []
+    for _ in range(2):
+        main(["steady", str(EXAMPLE_PATH), "--butterflies", "--seed", "7"])
+        outputs.append(capsys.readouterr().out)
+
+    assert "(seed 7)" in outputs[0]
+    assert outputs[0] == outputs[1]
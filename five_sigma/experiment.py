@@ -0,0 +1,107 @@
+"""
+Seeded experiment runner shared by the stochastic simulations.
+
+Every trial gets its own random.Random, seeded from the master seed and the
+trial's index through a numpy SeedSequence, so the streams are independent
+and a trial draws the same numbers whichever worker runs it, in whatever
+order and however the trials were chunked. Replaying a run only needs its
+master seed
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import numpy as np
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 1_000
+
+
+def new_master_seed() -> int:
+    """
+    A fresh master seed from the OS entropy pool, to be reported so the run
+    can be replayed
+    """
+    return int(np.random.SeedSequence().entropy)  # type: ignore[arg-type]
+
+
+def trial_rng(master_seed: int, trial: int) -> random.Random:
+    state = np.random.SeedSequence(
+        master_seed, spawn_key=(trial,)
+    ).generate_state(4)
+    return random.Random(int.from_bytes(state.tobytes(), "little"))
+
+
+def run_chunk(
+    trial_fn: Callable[[random.Random], T],
+    master_seed: int,
+    start: int,
+    stop: int,
+) -> List[T]:
+    return [
+        trial_fn(trial_rng(master_seed, trial)) for trial in range(start, stop)
+    ]
+
+
+def run_trials(
+    trial_fn: Callable[[random.Random], T],
+    trials: int,
+    master_seed: int,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[int, List[T]]]:
+    """
+    Run trial_fn once per trial and yield (first trial index, results) for
+    each chunk of trials as it finishes, so the caller can aggregate while
+    the rest are still running. Chunks arrive in completion order.
+
+    trial_fn is sent to the worker processes so has to be picklable, a
+    module level function or a functools.partial of one. max_workers=1 runs
+    the chunks in this process instead, in order
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    chunks = (
+        (start, min(start + chunk_size, trials))
+        for start in range(0, trials, chunk_size)
+    )
+
+    if max_workers == 1:
+        for start, stop in chunks:
+            yield start, run_chunk(trial_fn, master_seed, start, stop)
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    remaining = iter(chunks)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded number of chunks in flight so a run of millions of
+        # trials doesn't queue millions of futures up front
+        pending: Dict[Future[List[T]], int] = {}
+
+        def submit_until_full() -> None:
+            for start, stop in remaining:
+                future = executor.submit(
+                    run_chunk, trial_fn, master_seed, start, stop
+                )
+                pending[future] = start
+                if len(pending) >= 2 * workers:
+                    return
+
+        submit_until_full()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+            submit_until_full()
@@ -0,0 +1,34 @@
+import random
+import pytest
+
+from five_sigma.experiment import run_trials, trial_rng
+
+
+def _draw(rng: random.Random) -> float:
+    return rng.random()
+
+
+def _collect(results):
+    draws = {}
+    for start, chunk in results:
+        draws.update(enumerate(chunk, start))
+    return [draws[idx] for idx in sorted(draws)]
+
+
+def test_trial_rng__replays() -> None:
+    assert trial_rng(42, 7).random() == trial_rng(42, 7).random()
+    assert trial_rng(42, 7).random() != trial_rng(42, 8).random()
+    assert trial_rng(42, 7).random() != trial_rng(43, 7).random()
+
+
+def test_run_trials__independent_of_scheduling() -> None:
+    serial = _collect(run_trials(_draw, 25, 42, chunk_size=25, max_workers=1))
+    pooled = _collect(run_trials(_draw, 25, 42, chunk_size=4, max_workers=2))
+
+    assert len(serial) == 25
+    assert serial == pooled
+
+
+def test_run_trials__chunk_size() -> None:
+    with pytest.raises(ValueError):
+        list(run_trials(_draw, 10, 42, chunk_size=0, max_workers=1))
@@ -22,22 +22,28 @@ computational complexity? No additional code is needed for this step.
 
 import random
 
-# TODO: Threading to improve performance of simulation
-# import threading
-
+from functools import partial
 from rich.console import Console
-from rich.progress import track
+from rich.progress import Progress
 from typing import Dict, Optional
 
+from five_sigma.experiment import new_master_seed, run_trials
+
 CONCERT_SIZE = 100
 SIMULATION_SIZE = 100_000
 
 
 class Concert:
-    def __init__(self, size: int) -> None:
+    def __init__(
+        self, size: int, *, rng: Optional[random.Random] = None
+    ) -> None:
         if not isinstance(size, int):
             raise TypeError("Please provide an integer size for the concert")
 
+        # Every random draw goes through this so a seeded rng replays the
+        # same seating
+        self._rng = rng if rng is not None else random.Random()
+
         # create a list of customers and assign them their seats while
         # retaining the order of customers as the key
         self._customers = {val: val for val in range(size)}
@@ -50,14 +56,14 @@ class Concert:
 
     def _seat_customer(self, distruption_idx: int) -> None:
         # Assign the random seat for the disruption index
-        self._customers[distruption_idx] = random.randint(0, self._size - 1)
+        self._customers[distruption_idx] = self._rng.randint(0, self._size - 1)
         available_seats = set(self.seating.keys())
 
         for customer, ticket in self._customers.items():
             position = ticket
 
             if not self.seating[position] is None:
-                position = random.choice(tuple(available_seats))
+                position = self._rng.choice(tuple(available_seats))
 
             self.seating[position] = customer
             available_seats.remove(position)
@@ -70,8 +76,6 @@ class Concert:
         return last_seat == last_customer
 
     def simulate_seating(self, distruption_idx: int = 0) -> bool:
-        # TODO: Make this thread safe to improve the performance of multiple
-        #       simulations
         assert (
             distruption_idx < self._size
         ), "Must give an index within the size of the concert"
@@ -83,21 +87,45 @@ class Concert:
         return self._check_last_seat()
 
 
-def simulate_concerts() -> None:
+def seating_trial(rng: random.Random, size: int = CONCERT_SIZE) -> bool:
+    return Concert(size, rng=rng).simulate_seating()
+
+
+def simulate_concerts(
+    size: int = CONCERT_SIZE,
+    simulations: int = SIMULATION_SIZE,
+    *,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> None:
+    """
+    Monte carlo the seating over a process pool, the same seed always gives
+    the same probability whatever the number of workers
+    """
+    if simulations < 1:
+        raise ValueError("Please simulate at least one concert")
+
     console = Console()
+    if seed is None:
+        seed = new_master_seed()
     console.print(
-        f"Preparing to simulate {SIMULATION_SIZE} concert"
-        f"seatings for {CONCERT_SIZE} customers"
+        f"Preparing to simulate {simulations} concert"
+        f"seatings for {size} customers (seed {seed})"
     )
 
-    results = []
-    for _ in track(
-        range(SIMULATION_SIZE), description="Simulating concerts ..."
-    ):
-        results.append(Concert(CONCERT_SIZE).simulate_seating())
-
-    true_cases = len([val for val in results if val])
-    console.print(f"Probability: {true_cases/SIMULATION_SIZE:.4%}")
+    true_cases = 0
+    with Progress(console=console) as progress:
+        task = progress.add_task("Simulating concerts ...", total=simulations)
+        for _, results in run_trials(
+            partial(seating_trial, size=size),
+            simulations,
+            seed,
+            max_workers=max_workers,
+        ):
+            true_cases += sum(results)
+            progress.advance(task, len(results))
+
+    console.print(f"Probability: {true_cases/simulations:.4%}")
 
 
 if __name__ == "__main__":
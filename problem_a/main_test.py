@@ -1,5 +1,6 @@
+import random
 import pytest
-from .main import Concert
+from .main import Concert, simulate_concerts
 
 
 @pytest.mark.parametrize("size", [(5), (10), (15)])
@@ -26,3 +27,18 @@ def test_simulate_concert__big():
     assert all(val is not None for val in concert.seating.values())
     assert set(concert.seating.keys()) == set(range(size))
     assert set(concert.seating.values()) == set(range(size))
+
+
+def test_simulate_concert__seeded():
+    seatings = []
+    for _ in range(2):
+        concert = Concert(size=50, rng=random.Random(3))
+        concert.simulate_seating()
+        seatings.append(concert.seating)
+
+    assert seatings[0] == seatings[1]
+
+
+def test_simulate_concerts__no_simulations():
+    with pytest.raises(ValueError):
+        simulate_concerts(simulations=0)
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import numpy as np
+
+from typing import Dict, List, NamedTuple, Sequence
+
+from problem_b.board import Board
+from problem_b.tile import Caterpiller, Field, Flower
+
+# Tile type codes used in the batched state
+FIELD = 0
+FLOWER = 1
+CATERPILLER = 2
+
+TILE_CODES = {Field: FIELD, Flower: FLOWER, Caterpiller: CATERPILLER}
+
+
+class SteadyStates(NamedTuple):
+    """
+    Per board outcome of GardenBatch.simulate_till_steady, each the value
+    Board gives for the same garden: step_count, the loop length returned by
+    simulate_till_steady (0 when the limit was hit) and score. steady is
+    False for the boards that hit the simulation limit
+    """
+
+    step_count: np.ndarray
+    loop_length: np.ndarray
+    score: np.ndarray
+    steady: np.ndarray
+
+
+def _neighbour_counts(mask: np.ndarray) -> np.ndarray:
+    """
+    Number of set cells in the in-bounds 8 neighbourhood of every cell, for a
+    stack of (N, H, W) boolean boards
+    """
+    _, height, width = mask.shape
+    padded = np.pad(mask.astype(np.int8), ((0, 0), (1, 1), (1, 1)))
+
+    counts = np.zeros(mask.shape, dtype=np.int8)
+    for dy in range(3):
+        for dx in range(3):
+            if dy == 1 and dx == 1:
+                continue
+            counts += padded[:, dy : dy + height, dx : dx + width]
+
+    return counts
+
+
+class GardenBatch:
+    """
+    Many gardens of the same shape simulated together in lockstep. The tile
+    types and flower ages of every board live in (N, H, W) arrays and a step
+    is a handful of array operations over all of them, rather than a Python
+    loop over every tile of every board.
+
+    Butterflies move at random so only plain gardens can be batched
+    """
+
+    types: np.ndarray
+    ages: np.ndarray
+    step_count: np.ndarray
+    score: np.ndarray
+
+    _simulation_limit: int
+
+    def __init__(
+        self,
+        types: np.ndarray,
+        ages: np.ndarray,
+        step_count: np.ndarray,
+        score: np.ndarray,
+    ) -> None:
+        if types.ndim != 3 or types.shape != ages.shape:
+            raise ValueError("types and ages must both be (N, H, W) arrays")
+
+        self.types = types
+        self.ages = ages
+        self.step_count = step_count
+        self.score = score
+
+        # Same limit as Board so the results match it
+        self._simulation_limit = 1_000
+
+    @classmethod
+    def from_boards(cls, boards: Sequence[Board]) -> GardenBatch:
+        if not boards:
+            raise ValueError("Can't batch an empty list of boards")
+
+        shape = (boards[0].height, boards[0].width)
+        if any((board.height, board.width) != shape for board in boards):
+            raise ValueError("Batched boards must all have the same shape")
+        if any(board._with_butterflies for board in boards):
+            raise ValueError("Boards with butterflies can't be batched")
+
+        types = np.array(
+            [
+                [
+                    [TILE_CODES[type(tile)] for tile in row]
+                    for row in board.board
+                ]
+                for board in boards
+            ],
+            dtype=np.int8,
+        )
+        ages = np.array(
+            [
+                [[tile.age for tile in row] for row in board.board]
+                for board in boards
+            ],
+            dtype=np.int64,
+        )
+        # Only flower ages are ever scored
+        ages[types != FLOWER] = 0
+
+        return cls(
+            types,
+            ages,
+            np.array([board.step_count for board in boards], dtype=np.int64),
+            np.array([board.score for board in boards], dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def simulate(self, active: np.ndarray) -> None:
+        """
+        Step the boards selected by the active mask once, the rest are left
+        as they are
+        """
+        types = self.types[active]
+        ages = self.ages[active]
+
+        flowers = types == FLOWER
+        caterpillers = types == CATERPILLER
+        flower_counts = _neighbour_counts(flowers)
+        caterpiller_counts = _neighbour_counts(caterpillers)
+
+        new_flowers = (types == FIELD) & (flower_counts >= 3)
+        eaten = flowers & (caterpiller_counts >= 3)
+        surviving_flowers = flowers & ~eaten
+        surviving_caterpillers = (
+            caterpillers & (caterpiller_counts >= 1) & (flower_counts >= 1)
+        )
+
+        new_types = np.full_like(types, FIELD)
+        new_types[new_flowers | surviving_flowers] = FLOWER
+        new_types[eaten | surviving_caterpillers] = CATERPILLER
+
+        # Surviving flowers score their new age, new flowers start at 0
+        new_ages = np.where(surviving_flowers, ages + 1, 0)
+        self.score[active] += new_ages.sum(axis=(1, 2)) - (
+            surviving_caterpillers.sum(axis=(1, 2))
+        )
+
+        self.types[active] = new_types
+        self.ages[active] = new_ages
+        self.step_count[active] += 1
+
+    def simulate_till_steady(self) -> SteadyStates:
+        """
+        Simulate every board until it repeats, the same as calling
+        Board.simulate_till_steady on each. A board stops stepping as soon as
+        it repeats while the others carry on
+        """
+        count = 0
+        previous_sims: List[Dict[bytes, int]] = [
+            {board.tobytes(): count} for board in self.types
+        ]
+        loop_length = np.zeros(len(self), dtype=np.int64)
+        steady = np.zeros(len(self), dtype=bool)
+
+        active = self.step_count < self._simulation_limit
+        while active.any():
+            self.simulate(active)
+            count += 1
+
+            for idx in np.flatnonzero(active):
+                board_bytes = self.types[idx].tobytes()
+                seen = previous_sims[idx]
+                if board_bytes in seen:
+                    loop_length[idx] = count - seen[board_bytes]
+                    steady[idx] = True
+                else:
+                    seen[board_bytes] = count
+
+            active &= ~steady & (self.step_count < self._simulation_limit)
+
+        return SteadyStates(
+            self.step_count.copy(), loop_length, self.score.copy(), steady
+        )
@@ -0,0 +1,63 @@
+import random
+import pytest
+
+from io import StringIO
+from pathlib import Path
+
+from problem_b.batch import GardenBatch
+from problem_b.board import Board
+
+
+def _random_gardens(count: int, height: int, width: int):
+    rng = random.Random(0)
+    return [
+        "\n".join(
+            "".join(rng.choice(" *~") for _ in range(width))
+            for _ in range(height)
+        )
+        for _ in range(count)
+    ]
+
+
+def test_simulate_till_steady__matches_board() -> None:
+    path = Path(__file__).parent / "input" / "example_1.txt"
+    gardens = [path.read_text(), *_random_gardens(30, 10, 10)]
+
+    expected = []
+    for garden in gardens:
+        board = Board.from_file(StringIO(garden))
+        loops = board.simulate_till_steady()
+        expected.append((board.step_count, loops, board.score))
+
+    batch = GardenBatch.from_boards(
+        [Board.from_file(StringIO(garden)) for garden in gardens]
+    )
+    result = batch.simulate_till_steady()
+
+    assert result.steady.all()
+    assert (
+        list(zip(result.step_count, result.loop_length, result.score))
+        == expected
+    )
+
+
+def test_simulate_till_steady__continues_from_board() -> None:
+    board = Board.from_file(StringIO(_random_gardens(1, 6, 6)[0]))
+    board.simulate()
+    board.simulate()
+
+    result = GardenBatch.from_boards([board]).simulate_till_steady()
+    loops = board.simulate_till_steady()
+
+    assert result.step_count[0] == board.step_count
+    assert result.loop_length[0] == loops
+    assert result.score[0] == board.score
+
+
+def test_from_boards__shapes_must_match() -> None:
+    boards = [
+        Board.from_file(StringIO(garden)) for garden in (" * \n * ", "  \n  ")
+    ]
+
+    with pytest.raises(ValueError):
+        GardenBatch.from_boards(boards)
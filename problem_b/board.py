@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import random
+
 from io import StringIO
 from rich.panel import Panel
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from problem_b.butterfly import Butterfly
+from problem_b.steady_state import SteadyStateCriterion, StationarityDetector
 
 from problem_b.tile import (
     TILE_VALUE_TYPES_MAP,
+    Caterpiller,
+    Flower,
     Tile,
 )
 from problem_b.utils import get_adjacent_units, matrix_dimensions
@@ -18,6 +23,7 @@ class Board:
     height: int
     width: int
     board: List[List[Tile]]
+    steady_state: Optional[SteadyStateCriterion]
 
     # Internal properties for use within the class only
     _simulation_limit: int
@@ -25,11 +31,17 @@ class Board:
     _butterfly_chance: float
     _butterfly_mortality: float
     _butterflies: List[Butterfly]
+    _rng: random.Random
+    _steady_window: int
+    _steady_rel_tolerance: float
+    _steady_abs_tolerance: float
 
     def __init__(
         self,
         board: List[List[Tile]],
         with_butterflies: bool = False,
+        *,
+        rng: Optional[random.Random] = None,
     ) -> None:
         width, height = matrix_dimensions(board)
 
@@ -38,6 +50,7 @@ class Board:
         self.height = height
         self.width = width
         self.board = board
+        self.steady_state = None
 
         self._simulation_limit = 1_000
         self._with_butterflies = with_butterflies
@@ -50,6 +63,15 @@ class Board:
         # important to know how they behave
         self._butterflies = []
 
+        # Butterflies draw from this rather than the global random module so
+        # a seeded rng replays the same garden
+        self._rng = rng if rng is not None else random.Random()
+
+        # Tolerances for the statistical steady state used with butterflies
+        self._steady_window = 25
+        self._steady_rel_tolerance = 0.05
+        self._steady_abs_tolerance = 1.0
+
     def __repr__(self) -> str:
         """
         We define a repr method here so that comparing board states and
@@ -78,6 +100,30 @@ class Board:
 
         return "".join(rows)
 
+    @property
+    def tile_repr(self) -> str:
+        """
+        The board string without any butterflies drawn over it. Butterflies
+        move at random so this is what we compare when looking for cycles in
+        the underlying garden
+        """
+        return "\n".join(
+            "".join(str(tile) for tile in row) for row in self.board
+        )
+
+    @property
+    def population(self) -> Tuple[int, int, int]:
+        flowers = 0
+        caterpillers = 0
+        for row in self.board:
+            for tile in row:
+                if isinstance(tile, Flower):
+                    flowers += 1
+                elif isinstance(tile, Caterpiller):
+                    caterpillers += 1
+
+        return flowers, caterpillers, len(self._butterflies)
+
     @property
     def rich_repr(self) -> str:
         """
@@ -131,14 +177,18 @@ class Board:
 
     @classmethod
     def from_file(
-        cls, buffer: StringIO, *, with_butterflies: bool = False
+        cls,
+        buffer: StringIO,
+        *,
+        with_butterflies: bool = False,
+        rng: Optional[random.Random] = None,
     ) -> Board:
         board = []
         with buffer as file:
             for idx, row_str in enumerate(file):
                 board.append(cls._initialise_row(row_str, idx))
 
-        return cls(board, with_butterflies)
+        return cls(board, with_butterflies, rng=rng)
 
     def simulate(self) -> None:
         new_board: List[List[Optional[Tile]]] = [
@@ -161,18 +211,28 @@ class Board:
             new_butterflies = Butterfly.create(
                 prev_board=self.board,
                 new_board=new_board,  # type: ignore
+                rng=self._rng,
                 spawn_probability=self._butterfly_chance,
                 mortality=self._butterfly_mortality,
             )
             self._butterflies = Butterfly.simulate(
                 butterflies=self._butterflies + new_butterflies,
                 board=self.board,
+                rng=self._rng,
             )
 
         self.board = new_board  # type: ignore
         self.step_count += 1
 
     def simulate_till_steady(self) -> int:
+        """
+        Simulate until the board repeats and return the length of the loop it
+        settled into, or 0 when no loop was found. The reason we stopped is
+        recorded on steady_state
+        """
+        if self._with_butterflies:
+            return self._simulate_till_stationary()
+
         loop = True
         board_str = ""
         count = 0
@@ -187,4 +247,76 @@ class Board:
                 count += 1
                 previous_sims[board_str] = count
 
+        self.steady_state = (
+            SteadyStateCriterion.SIMULATION_LIMIT
+            if loop
+            else SteadyStateCriterion.BOARD_CYCLE
+        )
         return count - previous_sims[board_str]
+
+    def _stationarity_sample(self, score_delta: int) -> Tuple[float, ...]:
+        flowers, caterpillers, butterflies = self.population
+        return (
+            flowers,
+            caterpillers,
+            butterflies,
+            score_delta / max(flowers, 1),
+        )
+
+    def _stationarity_detector(self) -> StationarityDetector:
+        # The score per flower tracks the mean flower age, which only ever
+        # drifts upwards if it isn't settled, so it gets no relative slack
+        return StationarityDetector(
+            self._steady_window,
+            rel_tolerance=(
+                self._steady_rel_tolerance,
+                self._steady_rel_tolerance,
+                self._steady_rel_tolerance,
+                0.0,
+            ),
+            abs_tolerance=self._steady_abs_tolerance,
+        )
+
+    def _simulate_till_stationary(self) -> int:
+        """
+        Butterflies move at random so the exact board almost never repeats. We
+        stop on whichever comes first of an exact repeat, a repeat of the tiles
+        underneath the butterflies, or the populations and score settling
+        within tolerance over a rolling window.
+
+        The score is tracked as the per step score delta over the number of
+        flowers, roughly the mean flower age. It only settles once flowers are
+        being eaten and replaced as fast as they age, a garden whose flowers
+        keep getting older keeps drifting and isn't stationary
+        """
+        detector = self._stationarity_detector()
+
+        count = 0
+        previous_sims: Dict[str, int] = {str(self): count}
+        previous_tiles: Dict[str, int] = {self.tile_repr: count}
+        previous_score = self.score
+
+        while self.step_count < self._simulation_limit:
+            self.simulate()
+            count += 1
+
+            board_str = str(self)
+            if board_str in previous_sims:
+                self.steady_state = SteadyStateCriterion.BOARD_CYCLE
+                return count - previous_sims[board_str]
+            previous_sims[board_str] = count
+
+            tile_str = self.tile_repr
+            if tile_str in previous_tiles:
+                self.steady_state = SteadyStateCriterion.TILE_CYCLE
+                return count - previous_tiles[tile_str]
+            previous_tiles[tile_str] = count
+
+            delta = self.score - previous_score
+            previous_score = self.score
+            if detector.observe(self._stationarity_sample(delta)):
+                self.steady_state = SteadyStateCriterion.STATIONARY
+                return 0
+
+        self.steady_state = SteadyStateCriterion.SIMULATION_LIMIT
+        return 0
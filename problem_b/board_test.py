@@ -1,8 +1,12 @@
+import random
+
 from io import StringIO
+from pathlib import Path
 from typing import Tuple
 
 import pytest
 from problem_b.board import Board
+from problem_b.steady_state import SteadyStateCriterion, StationarityDetector
 from problem_b.tile import Caterpiller, Field, Flower
 from problem_b.utils import get_adjacent_units
 
@@ -114,3 +118,63 @@ def test_spawn_butterflies() -> None:
 
     board.simulate()
     assert "B" in str(board)
+
+
+def test_simulate_till_steady__board_cycle() -> None:
+    board = Board.from_file(StringIO("   \n * \n   "))
+
+    assert board.simulate_till_steady() == 1
+    assert board.steady_state == SteadyStateCriterion.BOARD_CYCLE
+
+
+def test_simulate_till_steady__butterflies_stop_early() -> None:
+    path = Path(__file__).parent / "input" / "example_1.txt"
+    board = Board.from_file(
+        StringIO(path.read_text()),
+        with_butterflies=True,
+        rng=random.Random(7),
+    )
+
+    board.simulate_till_steady()
+
+    assert board.step_count < board._simulation_limit
+    assert board.steady_state != SteadyStateCriterion.SIMULATION_LIMIT
+
+
+def test_simulate_till_steady__butterflies_seeded() -> None:
+    path = Path(__file__).parent / "input" / "example_1.txt"
+    runs = []
+    for _ in range(2):
+        board = Board.from_file(
+            StringIO(path.read_text()),
+            with_butterflies=True,
+            rng=random.Random(11),
+        )
+        loops = board.simulate_till_steady()
+        runs.append((board.step_count, loops, board.score, str(board)))
+
+    assert runs[0] == runs[1]
+
+
+def test_stationarity_sample__drifting_score() -> None:
+    # A full bed of flowers never changes but every flower scores one more
+    # each step, so the populations settle while the score keeps drifting
+    board = Board.from_file(StringIO("***\n***\n***"))
+    detector = board._stationarity_detector()
+
+    while board.step_count < board._simulation_limit:
+        previous_score = board.score
+        board.simulate()
+        sample = board._stationarity_sample(board.score - previous_score)
+        assert not detector.observe(sample)
+
+    assert board.population == (9, 0, 0)
+
+
+def test_stationarity_detector() -> None:
+    detector = StationarityDetector(3, rel_tolerance=0, abs_tolerance=0.5)
+
+    assert not any(detector.observe((val, 1)) for val in [10, 8, 6, 4, 2])
+    assert not detector.observe((0, 1))
+    assert not any(detector.observe((5, 1)) for _ in range(5))
+    assert detector.observe((5, 1))
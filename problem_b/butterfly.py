@@ -40,6 +40,7 @@ class Butterfly:
         *,
         prev_board: List[List[Tile]],
         new_board: List[List[Tile]],
+        rng: random.Random,
         spawn_probability: float = 0.01,
         mortality: float = 0.1,
     ) -> List[Butterfly]:
@@ -68,12 +69,14 @@ class Butterfly:
                 ), "This should never happen"
 
                 probability = int(1 / spawn_probability)
-                if random.randint(1, probability) == probability:
+                if rng.randint(1, probability) == probability:
                     butterflies.append(cls(x, y, mortality=mortality))
 
         return butterflies
 
-    def move(self, board: List[List[Tile]]) -> Optional[Butterfly]:
+    def move(
+        self, board: List[List[Tile]], rng: random.Random
+    ) -> Optional[Butterfly]:
         x, y = self.position
         # Check for flower and create Caterpiller if true
         if isinstance(board[y][x], Flower):
@@ -83,7 +86,7 @@ class Butterfly:
         # Check if it dies
         if 1 >= self.mortality > 0:
             mortality = int(1 / self.mortality)
-            if random.randint(1, mortality) == mortality:
+            if rng.randint(1, mortality) == mortality:
                 return None
 
         # otherwise move the butterfly
@@ -92,7 +95,7 @@ class Butterfly:
         ]
 
         self.x, self.y = available_positions[
-            random.randint(0, len(available_positions) - 1)
+            rng.randint(0, len(available_positions) - 1)
         ]
 
         return self
@@ -103,10 +106,11 @@ class Butterfly:
         *,
         butterflies: List[Butterfly],
         board: List[List[Tile]],
+        rng: random.Random,
     ) -> List[Butterfly]:
         new_butterflies: List[Butterfly] = []
         for butterfly in butterflies:
-            updated_butterfly = butterfly.move(board)
+            updated_butterfly = butterfly.move(board, rng)
             if updated_butterfly:
                 new_butterflies.append(updated_butterfly)
 
@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import random
+
+from collections import Counter
+from functools import partial
 from io import StringIO
 from pathlib import Path
 from rich.console import Console
 from rich.columns import Columns
 from typer import Typer, Argument, Option
+from typing import Optional, Tuple
 
+from five_sigma.experiment import new_master_seed, run_trials, trial_rng
 from problem_b.board import Board
 
 
 app = Typer()
 
 
+def _seed_note(seed: int, butterflies: bool) -> str:
+    # Gardens without butterflies never draw from the rng
+    return f" (seed {seed})" if butterflies else ""
+
+
 @app.command("simulate_garden")
 def simulate_garden(
     file_path: str = Argument(None),
@@ -19,6 +30,7 @@ def simulate_garden(
     butterflies: bool = Option(
         False, is_flag=True, help="Enable butterflies in the simulation"
     ),
+    seed: Optional[int] = Option(None, help="Master seed to replay a run"),
 ) -> None:
     console = Console()
 
@@ -26,9 +38,14 @@ def simulate_garden(
     if not path.exists():
         raise FileNotFoundError("File does not exist")
 
+    if seed is None:
+        seed = new_master_seed()
     buffer = StringIO(path.read_bytes().decode("utf-8"))
-    board = Board.from_file(buffer, with_butterflies=butterflies)
-    console.print(f"Simulating Map over {generations} steps:")
+    board = Board.from_file(
+        buffer, with_butterflies=butterflies, rng=trial_rng(seed, 0)
+    )
+    note = _seed_note(seed, butterflies)
+    console.print(f"Simulating Map over {generations} steps{note}:")
 
     with console.status(
         "[green]Simulating gardens ...[/green]", spinner="dots"
@@ -49,30 +66,100 @@ def simulate_till_steady(
     butterflies: bool = Option(
         False, is_flag=True, help="Enable butterflies in the simulation"
     ),
+    seed: Optional[int] = Option(None, help="Master seed to replay a run"),
 ) -> None:
     console = Console()
 
-    console.print("Simulating Steady state:")
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError("File does not exist")
 
+    if seed is None:
+        seed = new_master_seed()
     buffer = StringIO(path.read_bytes().decode("utf-8"))
-    board = Board.from_file(buffer, with_butterflies=butterflies)
+    board = Board.from_file(
+        buffer, with_butterflies=butterflies, rng=trial_rng(seed, 0)
+    )
+    console.print(f"Simulating Steady state{_seed_note(seed, butterflies)}:")
 
     with console.status(
         "[green]Simulating gardens ...[/green]", spinner="dots"
     ):
         simulation_loops = board.simulate_till_steady()
 
-    console.print(f"Steady state found after {board.step_count} iterations")
+    console.print(
+        f"Steady state found after {board.step_count} iterations"
+        f" ({board.steady_state.value if board.steady_state else 'unknown'})"
+    )
     console.print(board.rich_panel)
 
-    if simulation_loops != 1:
+    if simulation_loops > 1:
         console.print(
             f"Steady state is a loop of {simulation_loops} simulation steps"
         )
 
 
+def steady_state_replica(
+    rng: random.Random, board_text: str
+) -> Tuple[int, int, int, str]:
+    """
+    One butterfly garden run till steady, giving the steps taken, loop
+    length, score and the criterion that stopped it
+    """
+    board = Board.from_file(
+        StringIO(board_text), with_butterflies=True, rng=rng
+    )
+    loops = board.simulate_till_steady()
+    criterion = board.steady_state.value if board.steady_state else "unknown"
+    return board.step_count, loops, board.score, criterion
+
+
+@app.command("simulate_replicas")
+def simulate_replicas(
+    file_path: str = Argument(None),
+    replicas: int = Argument(100),
+    seed: Optional[int] = Option(None, help="Master seed to replay a run"),
+    workers: Optional[int] = Option(None, help="Worker processes to use"),
+) -> None:
+    console = Console()
+
+    if replicas < 1:
+        raise ValueError("Please simulate at least one replica")
+
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError("File does not exist")
+
+    if seed is None:
+        seed = new_master_seed()
+    console.print(f"Simulating {replicas} butterfly gardens (seed {seed}):")
+
+    steps = 0
+    score = 0
+    criteria: Counter[str] = Counter()
+    with console.status(
+        "[green]Simulating gardens ...[/green]", spinner="dots"
+    ):
+        for _, results in run_trials(
+            partial(
+                steady_state_replica,
+                board_text=path.read_bytes().decode("utf-8"),
+            ),
+            replicas,
+            seed,
+            chunk_size=max(1, replicas // 100),
+            max_workers=workers,
+        ):
+            for step_count, _, replica_score, criterion in results:
+                steps += step_count
+                score += replica_score
+                criteria[criterion] += 1
+
+    console.print(f"Mean steps till steady: {steps / replicas:.2f}")
+    console.print(f"Mean score: {score / replicas:.2f}")
+    for criterion, count in criteria.most_common():
+        console.print(f"{criterion}: {count / replicas:.2%}")
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from enum import Enum
+from typing import Deque, Sequence, Tuple, Union
+
+
+class SteadyStateCriterion(str, Enum):
+    """
+    The reason a call to simulate_till_steady stopped, so callers can tell a
+    genuine loop apart from a statistical steady state or simply running out
+    of simulation steps
+    """
+
+    BOARD_CYCLE = "board cycle"
+    TILE_CYCLE = "tile cycle"
+    STATIONARY = "stationary"
+    SIMULATION_LIMIT = "simulation limit"
+
+
+class StationarityDetector:
+    """
+    Rolling window convergence check for stochastic simulations. We keep the
+    last two windows of observations and call the series stationary once the
+    mean of every metric in the newer window is close to the mean in the older
+    window, using the same relative and absolute tolerances as math.isclose.
+
+    The relative tolerance can be given per metric. A metric that drifts
+    steadily, like an age, needs an absolute tolerance only, otherwise any
+    steady drift passes once the values have grown large enough
+    """
+
+    window: int
+    rel_tolerance: Union[float, Sequence[float]]
+    abs_tolerance: float
+    _history: Deque[Tuple[float, ...]]
+
+    def __init__(
+        self,
+        window: int = 25,
+        *,
+        rel_tolerance: Union[float, Sequence[float]] = 0.05,
+        abs_tolerance: float = 1.0,
+    ) -> None:
+        if window < 1:
+            raise ValueError("Window must contain at least one observation")
+
+        self.window = window
+        self.rel_tolerance = rel_tolerance
+        self.abs_tolerance = abs_tolerance
+        self._history = deque(maxlen=2 * window)
+
+    def observe(self, sample: Sequence[float]) -> bool:
+        self._history.append(tuple(sample))
+        if len(self._history) < 2 * self.window:
+            return False
+
+        rel_tolerances = (
+            [self.rel_tolerance] * len(sample)
+            if isinstance(self.rel_tolerance, (int, float))
+            else list(self.rel_tolerance)
+        )
+        if len(rel_tolerances) != len(sample):
+            raise ValueError("Need one relative tolerance per metric")
+
+        history = list(self._history)
+        older = history[: self.window]
+        newer = history[self.window :]
+        return all(
+            math.isclose(
+                _mean(older, idx),
+                _mean(newer, idx),
+                rel_tol=rel_tolerance,
+                abs_tol=self.abs_tolerance,
+            )
+            for idx, rel_tolerance in enumerate(rel_tolerances)
+        )
+
+
+def _mean(samples: Sequence[Tuple[float, ...]], idx: int) -> float:
+    return sum(sample[idx] for sample in samples) / len(samples)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from typing import List
+
+# Columns of the partial sums every weighted aggregation is built from. These
+# sums can be added together across chunks or tapes before being summarised
+WEIGHT = "Weight"
+WEIGHTED_VALUE = "Weighted value"
+COUNT = "Count"
+
+# Columns of the summarised table
+WEIGHTED_MEAN = "Weighted mean"
+WEIGHT_SHARE = "Weight share"
+
+
+def weighted_sums(
+    df: pd.DataFrame,
+    value: str,
+    weight: str,
+    dimensions: List[str],
+    *,
+    dropna: bool = True,
+) -> pd.DataFrame:
+    """
+    Sum the weight, value x weight and row count for every observed
+    combination of the dimensions in a single groupby pass. Rows with a
+    missing dimension are dropped unless dropna is turned off
+    """
+    parts = df[dimensions].copy(deep=False)
+    parts[WEIGHT] = df[weight]
+    parts[WEIGHTED_VALUE] = df[value] * df[weight]
+    parts[COUNT] = 1
+
+    return parts.groupby(
+        dimensions, observed=True, sort=True, dropna=dropna
+    ).sum()
+
+
+def summarise_weighted(sums: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turn partial sums into weighted means, weight shares and counts. Groups
+    with no weight get a weighted mean of zero rather than a division error
+    """
+    total = sums[WEIGHT].sum()
+    weighted_mean = (sums[WEIGHTED_VALUE] / sums[WEIGHT]).where(
+        sums[WEIGHT] != 0, 0.0
+    )
+
+    return pd.DataFrame(
+        {
+            WEIGHTED_MEAN: weighted_mean,
+            WEIGHT_SHARE: sums[WEIGHT] / total if total else 0.0,
+            COUNT: sums[COUNT].astype(int),
+        },
+        index=sums.index,
+    )
+
+
+def weighted_aggregate(
+    df: pd.DataFrame,
+    value: str,
+    weight: str,
+    dimensions: List[str],
+) -> pd.DataFrame:
+    return summarise_weighted(weighted_sums(df, value, weight, dimensions))
@@ -0,0 +1,41 @@
+import pytest
+import pandas as pd
+
+from problem_c.aggregation import (
+    COUNT,
+    WEIGHT_SHARE,
+    WEIGHTED_MEAN,
+    weighted_aggregate,
+)
+
+
+def test_weighted_aggregate__single_dimension() -> None:
+    df = pd.DataFrame(
+        [
+            {"cat_1": "foo", "rate": 0.1, "capital": 100.0},
+            {"cat_1": "foo", "rate": 0.2, "capital": 300.0},
+            {"cat_1": "bar", "rate": 0.5, "capital": 600.0},
+        ]
+    )
+
+    result = weighted_aggregate(df, "rate", "capital", ["cat_1"])
+
+    assert list(result.index) == ["bar", "foo"]
+    assert result.loc["foo", WEIGHTED_MEAN] == pytest.approx(0.175)
+    assert result.loc["foo", WEIGHT_SHARE] == pytest.approx(0.4)
+    assert result.loc["bar", COUNT] == 1
+
+
+def test_weighted_aggregate__zero_weight() -> None:
+    df = pd.DataFrame(
+        [
+            {"cat_1": "foo", "cat_2": "bar", "rate": 0.1, "capital": 0.0},
+            {"cat_1": "foo", "cat_2": "baz", "rate": 0.2, "capital": 10.0},
+        ]
+    )
+
+    result = weighted_aggregate(df, "rate", "capital", ["cat_1", "cat_2"])
+
+    assert result.loc[("foo", "bar"), WEIGHTED_MEAN] == 0
+    assert result.loc[("foo", "baz"), WEIGHTED_MEAN] == pytest.approx(0.2)
+    assert result[COUNT].sum() == 2
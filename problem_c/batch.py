@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import warnings
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from rich.console import Console
+from rich.columns import Columns
+from typer import Typer, Argument, Option
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from problem_c.aggregation import WEIGHT
+from problem_c.cache import load_loan_tape
+from problem_c.cleaning import bucket_loan_tape
+from problem_c.cube import StratificationCube
+from problem_c.df_to_rich import dataframe_to_rich_table
+from problem_c.schema import read_loan_tape
+from problem_c.stratification import STRATIFICATIONS
+
+TAPE_SUFFIXES = (".xlsx", ".xls", ".csv")
+
+app = Typer()
+
+
+def discover_tapes(directory: Path) -> List[Tuple[str, Path]]:
+    """
+    Every loan tape in the directory paired with its period, taken from the
+    file name (e.g. 2023-10.xlsx) and sorted so periods run oldest first
+    """
+    tapes = [
+        (path.stem, path)
+        for path in directory.iterdir()
+        if path.is_file() and path.suffix in TAPE_SUFFIXES
+    ]
+    return sorted(tapes)
+
+
+# All a tape has to give up for the rating migration from it
+MIGRATION_COLUMNS = ["Loan id", "October Rating"]
+
+
+class TapeSummary(NamedTuple):
+    """
+    The small tables a worker hands back for a tape: its cube and the rating
+    migration from the previous tape, None for the first tape or when either
+    tape has no loan ids to match loans on
+    """
+
+    cube: StratificationCube
+    migration: Optional[pd.DataFrame]
+
+
+def _loan_ratings(df: pd.DataFrame) -> Optional[pd.Series]:
+    if "Loan id" not in df.columns:
+        return None
+
+    return df.set_index("Loan id")["October Rating"].astype(str).str.strip()
+
+
+def summarise_tape(path: Path, previous: Optional[Path] = None) -> TapeSummary:
+    """
+    Load, clean and aggregate a single tape along with its rating migration
+    from the previous tape, of which only the loan ids and ratings are read.
+    This runs in the worker processes and only the cube and the migration
+    matrix are sent back to the parent. The tapes are read around the cache
+    so nothing is written into the tape directory
+    """
+    df = load_loan_tape(path, use_cache=False)
+    cube = StratificationCube.from_frame(bucket_loan_tape(df))
+    if previous is None:
+        return TapeSummary(cube, None)
+
+    current_ratings = _loan_ratings(df)
+    previous_ratings = _loan_ratings(
+        read_loan_tape(previous, columns=MIGRATION_COLUMNS)
+    )
+    if current_ratings is None or previous_ratings is None:
+        return TapeSummary(cube, None)
+
+    return TapeSummary(
+        cube, rating_migration(previous_ratings, current_ratings)
+    )
+
+
+def rating_migration(previous: pd.Series, current: pd.Series) -> pd.DataFrame:
+    """
+    Share of the loans in both tapes moving from each rating in the previous
+    tape to each rating in the current one, given the rating of every loan
+    indexed by loan id
+    """
+    ratings = previous.to_frame("previous").join(
+        current.to_frame("current"), how="inner"
+    )
+    migration = pd.crosstab(
+        ratings["previous"], ratings["current"], normalize="index"
+    )
+    migration.index.name = "From rating"
+    migration.columns.name = None
+    return migration
+
+
+def period_shares(cubes: Dict[str, StratificationCube]) -> pd.DataFrame:
+    """
+    Share of remaining capital in every bucket of every stratification, with
+    a column per period
+    """
+    shares = {}
+    for period, cube in cubes.items():
+        period_tables = []
+        for strat in STRATIFICATIONS:
+            table = cube.rollup([strat])[WEIGHT] / cube.total_capital
+            table.index = pd.MultiIndex.from_product(
+                [[strat], table.index.astype(str)],
+                names=["Stratification", "Bucket"],
+            )
+            period_tables.append(table)
+        shares[period] = pd.concat(period_tables)
+
+    return pd.DataFrame(shares).fillna(0.0)
+
+
+def share_changes(shares: pd.DataFrame) -> pd.DataFrame:
+    """
+    Period over period change in share, labelled by the pair of periods
+    """
+    periods = list(shares.columns)
+    return pd.DataFrame(
+        {
+            f"{previous} -> {current}": shares[current] - shares[previous]
+            for previous, current in zip(periods, periods[1:])
+        },
+        index=shares.index,
+    )
+
+
+def compare_tapes(
+    directory: Path, max_workers: Optional[int] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Aggregate every tape in the directory in a process pool and merge the
+    results into period indexed shares, share changes and rating migrations
+    between consecutive periods. Migrations are skipped, with a warning, for
+    pairs where either tape has no loan ids
+    """
+    tapes = discover_tapes(directory)
+    if not tapes:
+        raise FileNotFoundError(f"No loan tapes found in {directory}")
+
+    periods = [period for period, _ in tapes]
+    paths = [path for _, path in tapes]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        summaries = dict(
+            zip(
+                periods,
+                executor.map(summarise_tape, paths, [None, *paths[:-1]]),
+            )
+        )
+
+    cubes = {period: summary.cube for period, summary in summaries.items()}
+
+    migrations = {}
+    for previous, current in zip(periods, periods[1:]):
+        migration = summaries[current].migration
+        if migration is None:
+            warnings.warn(
+                f"Skipping rating migration {previous} -> {current}, "
+                f"both tapes need a Loan id column"
+            )
+            continue
+
+        migrations[f"{previous} -> {current}"] = migration
+
+    shares = period_shares(cubes)
+    return shares, share_changes(shares), migrations
+
+
+@app.command("compare_tapes")
+def compare_tapes_command(
+    directory: str = Argument(None),
+    workers: Optional[int] = Option(
+        None, help="Number of worker processes, defaults to the cpu count"
+    ),
+) -> None:
+    console = Console()
+
+    path = Path(directory)
+    if not path.is_dir():
+        raise FileNotFoundError("Directory does not exist")
+
+    with console.status(
+        "[green]Aggregating tapes ...[/green]", spinner="dots"
+    ):
+        shares, changes, migrations = compare_tapes(path, workers)
+
+    console.print(dataframe_to_rich_table(shares))
+    if len(changes.columns):
+        console.print(dataframe_to_rich_table(changes))
+
+    migration_columns = Columns(padding=1)
+    for periods, migration in migrations.items():
+        table = dataframe_to_rich_table(migration)
+        table.title = f"Rating migration {periods}"
+        migration_columns.add_renderable(table)
+    console.print(migration_columns)
+
+
+if __name__ == "__main__":
+    app()
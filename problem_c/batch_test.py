@@ -0,0 +1,64 @@
+import pytest
+import pandas as pd
+
+from pathlib import Path
+
+from problem_c.batch import compare_tapes, discover_tapes
+
+
+def _write_tape(
+    path: Path, ratings: list, capital: list, loan_ids: bool = True
+) -> None:
+    df = pd.DataFrame(
+        {
+            "Loan id": [f"loan-{idx}" for idx in range(len(ratings))],
+            "October Rating": ratings,
+            "Annual rate": [0.05] * len(ratings),
+            "initial duration": [24] * len(ratings),
+            "Status": ["Ongoing"] * len(ratings),
+            "Remaining capital": capital,
+            "Country": ["fr"] * len(ratings),
+        }
+    )
+    if not loan_ids:
+        df = df.drop(columns="Loan id")
+    df.to_csv(path, index=False)
+
+
+def test_compare_tapes(tmp_path: Path) -> None:
+    _write_tape(tmp_path / "2023-09.csv", ["A", "A ", "B"], [50, 25, 25])
+    _write_tape(tmp_path / "2023-10.csv", ["A", "B", "B"], [25, 25, 50])
+    (tmp_path / "notes.txt").write_text("not a tape")
+
+    assert [period for period, _ in discover_tapes(tmp_path)] == [
+        "2023-09",
+        "2023-10",
+    ]
+
+    shares, changes, migrations = compare_tapes(tmp_path, max_workers=2)
+
+    assert list(shares.columns) == ["2023-09", "2023-10"]
+    assert shares.loc[("October Rating", "A"), "2023-09"] == 0.75
+    assert shares.loc[("October Rating", "B"), "2023-10"] == 0.75
+    assert changes.loc[
+        ("October Rating", "B"), "2023-09 -> 2023-10"
+    ] == pytest.approx(0.5)
+
+    migration = migrations["2023-09 -> 2023-10"]
+    assert migration.loc["A", "A"] == 0.5
+    assert migration.loc["A", "B"] == 0.5
+    assert migration.loc["B", "B"] == 1.0
+    assert not (tmp_path / ".cache").exists()
+
+
+def test_compare_tapes__without_loan_ids(tmp_path: Path) -> None:
+    _write_tape(tmp_path / "2023-09.csv", ["A", "B"], [50, 50])
+    _write_tape(tmp_path / "2023-10.csv", ["A", "B"], [75, 25], False)
+    _write_tape(tmp_path / "2023-11.csv", ["A", "A"], [50, 50], False)
+
+    with pytest.warns(UserWarning, match="Loan id"):
+        shares, _, migrations = compare_tapes(tmp_path, max_workers=2)
+
+    assert list(shares.columns) == ["2023-09", "2023-10", "2023-11"]
+    assert shares.loc[("October Rating", "A"), "2023-10"] == 0.75
+    assert migrations == {}
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import pandas as pd
+
+from contextlib import contextmanager
+from io import StringIO
+from pathlib import Path
+from rich.console import Console
+from typer import Typer, Argument, Option
+from typing import Any, Dict, Iterator, Optional
+
+from problem_c.cleaning import bucket_loan_tape, clean_loan_tape
+from problem_c.cube import StratificationCube
+from problem_c.df_to_rich import dataframe_to_rich_table
+from problem_c.schema import read_loan_tape
+from problem_c.synthetic import write_loan_tape
+
+STAGES = ("load", "clean", "bucket", "aggregate", "render")
+
+app = Typer()
+
+
+def _max_rss_bytes() -> Optional[int]:
+    """
+    High water mark of the process resident memory, reported in kilobytes on
+    linux and bytes on macOS. Not available on windows
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class StageTimer:
+    """
+    Records the wall time and memory of each pipeline stage.
+
+    By default memory is how far the stage raised the process high water
+    mark, which is free to read. The high water mark only ever grows over the
+    life of the process, so a stage that stays under the peak of an earlier
+    one records 0 rather than repeating that peak. With trace_memory the peak traced by tracemalloc
+    is recorded per stage as well, numpy reports its buffers to tracemalloc so
+    this covers the frames too. Tracing slows down anything allocating lots of
+    small python objects (string parsing especially) so stage times from a
+    traced run shouldn't be compared with an untraced one
+    """
+
+    stages: Dict[str, Dict[str, float]]
+    trace_memory: bool
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.stages = {}
+        self.trace_memory = trace_memory
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self.trace_memory:
+            tracemalloc.start()
+        start_rss = _max_rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.stages[name] = {"seconds": seconds}
+
+            max_rss = _max_rss_bytes()
+            if max_rss is not None and start_rss is not None:
+                self.stages[name]["max_rss_growth_bytes"] = max_rss - start_rss
+
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                self.stages[name]["peak_memory_bytes"] = peak
+
+
+def run_benchmark(path: Path, trace_memory: bool = False) -> Dict[str, Any]:
+    """
+    Time every stage of the stratification pipeline over a single tape
+    """
+    timer = StageTimer(trace_memory)
+
+    with timer.stage("load"):
+        df = read_loan_tape(path)
+    rows = len(df.index)
+
+    with timer.stage("clean"):
+        df = clean_loan_tape(df)
+
+    with timer.stage("bucket"):
+        df = bucket_loan_tape(df)
+
+    with timer.stage("aggregate"):
+        tables = StratificationCube.from_frame(df).tables()
+
+    with timer.stage("render"):
+        console = Console(file=StringIO(), width=200)
+        for table in tables:
+            console.print(dataframe_to_rich_table(table))
+
+    return {
+        "input": str(path),
+        "rows": rows,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "trace_memory": trace_memory,
+        "stages": timer.stages,
+    }
+
+
+def _ratio(
+    current: Dict[str, float], previous: Dict[str, float], key: str
+) -> float:
+    if not current.get(key) or not previous.get(key):
+        return float("nan")
+
+    return current[key] / previous[key]
+
+
+def compare_to_baseline(
+    result: Dict[str, Any], baseline: Dict[str, Any]
+) -> pd.DataFrame:
+    """
+    Ratio of each stage's time and memory against a baseline run, above 1.0
+    is slower or bigger than the baseline. Traced peaks are compared when both
+    runs traced memory, otherwise how far each stage raised the process high
+    water mark
+    """
+    memory_key = "max_rss_growth_bytes"
+    if result.get("trace_memory") and baseline.get("trace_memory"):
+        memory_key = "peak_memory_bytes"
+
+    rows = {}
+    for stage in STAGES:
+        current = result["stages"].get(stage)
+        previous = baseline["stages"].get(stage)
+        if not current or not previous:
+            continue
+
+        rows[stage] = {
+            "seconds": current["seconds"],
+            "baseline seconds": previous["seconds"],
+            "time ratio": _ratio(current, previous, "seconds"),
+            "memory ratio": _ratio(current, previous, memory_key),
+        }
+
+    comparison = pd.DataFrame.from_dict(rows, orient="index")
+    comparison.index.name = "Stage"
+    return comparison
+
+
+@app.command("generate_tape")
+def generate_tape_command(
+    file_path: str = Argument(None),
+    rows: int = Argument(10_000),
+    seed: int = Option(0, help="Seed for the generated tape"),
+) -> None:
+    console = Console()
+
+    with console.status("[green]Generating tape ...[/green]", spinner="dots"):
+        write_loan_tape(Path(file_path), rows, seed)
+
+    console.print(f"Wrote {rows} loans to {file_path}")
+
+
+@app.command("benchmark")
+def benchmark_command(
+    file_path: str = Argument(None),
+    output: Optional[str] = Option(None, help="Write the results as JSON"),
+    baseline: Optional[str] = Option(
+        None, help="JSON results of a previous run to compare against"
+    ),
+    trace_memory: bool = Option(
+        False, help="Trace peak memory per stage, this slows down the stages"
+    ),
+) -> None:
+    console = Console()
+
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError("File does not exist")
+
+    with console.status("[green]Benchmarking ...[/green]", spinner="dots"):
+        result = run_benchmark(path, trace_memory)
+
+    stages = pd.DataFrame.from_dict(result["stages"], orient="index")
+    stages.index.name = "Stage"
+    console.print(f"Benchmarked {result['rows']} loans from {path.name}")
+    console.print(dataframe_to_rich_table(stages))
+
+    if output:
+        Path(output).write_text(json.dumps(result, indent=2))
+
+    if baseline:
+        previous = json.loads(Path(baseline).read_text())
+        console.print(
+            dataframe_to_rich_table(compare_to_baseline(result, previous))
+        )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from problem_c.benchmark import STAGES, compare_to_baseline, run_benchmark
+from problem_c.synthetic import write_loan_tape
+
+
+def test_run_benchmark(tmp_path: Path) -> None:
+    path = tmp_path / "tape.csv"
+    write_loan_tape(path, 1_000)
+
+    result = run_benchmark(path)
+    traced = run_benchmark(path, trace_memory=True)
+
+    assert result["rows"] == 1_000
+    assert tuple(result["stages"]) == STAGES
+    assert all(stage["seconds"] > 0 for stage in result["stages"].values())
+    assert all(
+        stage["max_rss_growth_bytes"] >= 0
+        for stage in result["stages"].values()
+    )
+    assert all(
+        stage["peak_memory_bytes"] > 0 for stage in traced["stages"].values()
+    )
+
+    comparison = compare_to_baseline(result, result)
+    assert list(comparison.index) == list(STAGES)
+    assert (comparison["time ratio"] == 1.0).all()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Sequence
+
+
+class BinSpec(NamedTuple):
+    """
+    A precompiled, immutable set of bins. Values fall in (edge, next edge]
+    like pd.cut, and are assigned with a binary search over the sorted edges
+    straight to categorical codes. Nothing about the spec changes when it is
+    used so the same spec can bucket any number of frames, chunks or columns
+    from any thread
+    """
+
+    name: str
+    source: str
+    edges: np.ndarray
+    labels: Sequence[str]
+    dtype: pd.CategoricalDtype
+
+    def codes(self, values: pd.Series) -> np.ndarray:
+        """
+        Categorical codes for the values, -1 for anything missing or outside
+        the bins, including a value sitting on the lowest edge
+        """
+        array = values.to_numpy(dtype="float64", na_value=np.nan)
+        codes = np.searchsorted(self.edges, array, side="left") - 1
+        codes[(codes < 0) | (codes >= len(self.labels))] = -1
+        return codes.astype(np.int8 if len(self.labels) < 127 else np.int32)
+
+    def assign(self, values: pd.Series) -> pd.Series:
+        return pd.Series(
+            pd.Categorical.from_codes(self.codes(values), dtype=self.dtype),
+            index=values.index,
+            name=self.name,
+        )
+
+
+def compile_bin_spec(
+    name: str,
+    source: str,
+    bins: Sequence[float],
+    labels: Sequence[str],
+) -> BinSpec:
+    edges = np.array(bins, dtype="float64")
+    if len(edges) < 2 or not np.all(np.diff(edges) > 0):
+        raise ValueError(f"Bins for {name} must be strictly increasing")
+    if len(labels) != len(edges) - 1:
+        raise ValueError(f"{name} needs exactly one label per bin")
+
+    # Freeze the edges so no caller can shift the bins under everyone else
+    edges.setflags(write=False)
+    return BinSpec(
+        name=name,
+        source=source,
+        edges=edges,
+        labels=tuple(labels),
+        dtype=pd.CategoricalDtype(list(labels), ordered=True),
+    )
+
+
+BIN_SPECS = (
+    compile_bin_spec(
+        "Initial duration type",
+        "initial duration",
+        bins=[0.0, 10.0, 20.0, 30.0, 40.0, 50, 60, 70, 80, float("inf")],
+        labels=[
+            "<10 years",
+            "10-20 years",
+            "20-30 years",
+            "30-40 years",
+            "40-50 years",
+            "50-60 years",
+            "60-70 years",
+            "70-80 years",
+            "80+ years",
+        ],
+    ),
+    compile_bin_spec(
+        "Annual rate bucket",
+        "Annual rate",
+        bins=[
+            0.0,
+            0.02,
+            0.03,
+            0.04,
+            0.05,
+            0.06,
+            0.07,
+            0.08,
+            0.09,
+            float("inf"),
+        ],
+        labels=[
+            "<2%",
+            "2% - 3%",
+            "3% - 4%",
+            "4% - 5%",
+            "5% - 6%",
+            "6% - 7%",
+            "7% - 8%",
+            "8% - 9%",
+            ">9%",
+        ],
+    ),
+)
+
+BIN_SPECS_BY_NAME: Mapping[str, BinSpec] = MappingProxyType(
+    {spec.name: spec for spec in BIN_SPECS}
+)
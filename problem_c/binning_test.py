@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor
+
+from problem_c.binning import BIN_SPECS, compile_bin_spec
+
+
+@pytest.mark.parametrize("spec", BIN_SPECS, ids=lambda spec: spec.name)
+def test_assign__matches_pd_cut(spec) -> None:
+    edges = list(spec.edges)
+    values = pd.Series(
+        np.concatenate(
+            [
+                edges[:-1],
+                np.random.default_rng(0).uniform(-1, edges[-2] * 1.5, 1_000),
+                [np.nan, float("inf")],
+            ]
+        )
+    )
+
+    expected = pd.cut(values, bins=edges, labels=list(spec.labels))
+
+    pd.testing.assert_series_equal(
+        spec.assign(values), expected, check_names=False
+    )
+
+
+def test_assign__nullable_ints() -> None:
+    spec = BIN_SPECS[0]
+    values = pd.Series([0, 10, 11, None, 95], dtype="Int16")
+
+    assert list(spec.assign(values).cat.codes) == [-1, 0, 1, -1, 8]
+
+
+def test_assign__reusable_across_threads() -> None:
+    spec = BIN_SPECS[1]
+    chunks = [pd.Series(np.linspace(0, 0.12, 500)) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(spec.assign, chunks))
+
+    assert all(result.equals(results[0]) for result in results)
+    assert not spec.edges.flags.writeable
+
+
+def test_compile_bin_spec__validation() -> None:
+    with pytest.raises(ValueError):
+        compile_bin_spec("test", "val", [0, 2, 1], ["a", "b"])
+    with pytest.raises(ValueError):
+        compile_bin_spec("test", "val", [0, 1, 2], ["a"])
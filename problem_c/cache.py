@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pandas as pd
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from problem_c.cleaning import (
+    CLEANING_VERSION,
+    clean_loan_tape,
+    memory_usage,
+)
+from problem_c.schema import read_loan_tape
+
+CACHE_DIRECTORY = ".cache"
+
+
+def _cache_format() -> str:
+    """
+    Parquet needs pyarrow which is an optional dependency, pickle is always
+    available and keeps the categoricals intact
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "pickle"
+
+    return "parquet"
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+class LoanTapeCache:
+    """
+    Keeps a cleaned copy of a loan tape in a columnar binary file next to the
+    input so we only pay for parsing the spreadsheet once.
+
+    The cache is keyed on the input contents and CLEANING_VERSION. A matching
+    size and modification time is trusted without reading the input, if those
+    have changed we hash the contents before deciding to rebuild
+    """
+
+    path: Path
+    cache_dir: Path
+    hit: bool
+    raw_memory: Optional[int]
+
+    def __init__(self, path: Path, cache_dir: Optional[Path] = None) -> None:
+        self.path = path
+        self.cache_dir = cache_dir or path.parent / CACHE_DIRECTORY
+        self.hit = False
+        self.raw_memory = None
+
+    @property
+    def _metadata_path(self) -> Path:
+        return self.cache_dir / f"{self.path.name}.json"
+
+    def _data_path(self, fmt: str) -> Path:
+        return self.cache_dir / f"{self.path.name}.{fmt}"
+
+    def _read_metadata(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._metadata_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _is_valid(
+        self, metadata: Dict[str, Any], stat: os.stat_result
+    ) -> bool:
+        if metadata.get("cleaning_version") != CLEANING_VERSION:
+            return False
+        if metadata.get("format") != _cache_format():
+            return False
+        if not self._data_path(metadata["format"]).exists():
+            return False
+        if (metadata.get("size"), metadata.get("mtime_ns")) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return True
+
+        # The file was touched, only rebuild if the contents changed
+        if metadata.get("sha256") != _file_digest(self.path):
+            return False
+
+        metadata.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        self._write_metadata(metadata)
+        return True
+
+    def _write_metadata(self, metadata: Dict[str, Any]) -> None:
+        path = self._metadata_path
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(metadata, indent=2))
+        tmp.replace(path)
+
+    def load(self) -> pd.DataFrame:
+        stat = self.path.stat()
+        fmt = _cache_format()
+        metadata = self._read_metadata()
+
+        if metadata and self._is_valid(metadata, stat):
+            self.hit = True
+            self.raw_memory = metadata.get("raw_memory")
+            if fmt == "parquet":
+                return pd.read_parquet(self._data_path(fmt))
+            return pd.read_pickle(self._data_path(fmt))
+
+        self.hit = False
+        raw = read_loan_tape(self.path)
+        self.raw_memory = memory_usage(raw)
+        df = clean_loan_tape(raw)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        data_path = self._data_path(fmt)
+        tmp = data_path.with_name(f"{data_path.name}.{os.getpid()}.tmp")
+        if fmt == "parquet":
+            df.to_parquet(tmp)
+        else:
+            df.to_pickle(tmp)
+        tmp.replace(data_path)
+
+        self._write_metadata(
+            {
+                "source": self.path.name,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": _file_digest(self.path),
+                "cleaning_version": CLEANING_VERSION,
+                "format": fmt,
+                "raw_memory": self.raw_memory,
+            }
+        )
+        return df
+
+
+def load_loan_tape(path: Path, *, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Load and clean a loan tape, going through the on disk cache unless asked
+    not to
+    """
+    if not use_cache:
+        return clean_loan_tape(read_loan_tape(path))
+
+    return LoanTapeCache(path).load()
@@ -0,0 +1,49 @@
+import os
+import pandas as pd
+
+from pathlib import Path
+
+from problem_c.cache import LoanTapeCache
+
+
+def _write_tape(path: Path, rate: float) -> None:
+    pd.DataFrame(
+        [
+            {
+                "Country": "it",
+                "Status": "Ongoing",
+                "October Rating": "B ",
+                "Annual rate": rate,
+                "initial duration": 24,
+                "Remaining capital": 1000.0,
+            }
+        ]
+    ).to_csv(path, index=False)
+
+
+def test_loan_tape_cache__invalidation(tmp_path: Path) -> None:
+    path = tmp_path / "tape.csv"
+    _write_tape(path, 5.5)
+
+    cold = LoanTapeCache(path)
+    df = cold.load()
+    assert not cold.hit
+    assert df["Annual rate"][0] == 0.055
+    assert df["October Rating"][0] == "B"
+
+    warm = LoanTapeCache(path)
+    pd.testing.assert_frame_equal(warm.load(), df)
+    assert warm.hit
+    assert warm.raw_memory == cold.raw_memory
+
+    # Touching the file without changing it keeps the cache
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    touched = LoanTapeCache(path)
+    touched.load()
+    assert touched.hit
+
+    _write_tape(path, 0.07)
+    changed = LoanTapeCache(path)
+    assert changed.load()["Annual rate"][0] == 0.07
+    assert not changed.hit
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from typing import Dict
+
+from problem_c.binning import BIN_SPECS
+
+# Bump this whenever the output of clean_loan_tape changes so anything built
+# from a previously cleaned tape knows to rebuild
+CLEANING_VERSION = 2
+
+COUNTRY_INITIALS_MAPPING = {
+    "de": "Germany",
+    "es": "Spain",
+    "fr": "France",
+    "it": "Italy",
+    "nl": "Netherlands",
+}
+
+CATEGORICAL_COLUMNS = ["Country", "Status", "October Rating"]
+
+# Rates above this were typed in as percentages rather than fractions
+MISTYPED_RATE_THRESHOLD = 0.1
+
+
+def memory_usage(df: pd.DataFrame) -> int:
+    """
+    Total bytes held by the frame, including the python strings behind object
+    columns which pandas skips unless asked to look
+    """
+    return int(df.memory_usage(deep=True).sum())
+
+
+def clean_loan_tape(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalise the raw loan tape with whole column operations. Country initials
+    are expanded, mistyped percentage rates are scaled back to fractions and
+    stray whitespace is stripped from the ratings. The low cardinality string
+    columns are stored as categoricals as they repeat on every row
+    """
+    df = df.copy(deep=False)
+
+    country = df["Country"].map(COUNTRY_INITIALS_MAPPING)
+    unknown = df["Country"][country.isna() & df["Country"].notna()]
+    if len(unknown):
+        raise KeyError(f"Unknown country initials {sorted(unknown.unique())}")
+    df["Country"] = country
+
+    rate = df["Annual rate"]
+    df["Annual rate"] = rate.where(
+        ~(rate > MISTYPED_RATE_THRESHOLD), rate / 100
+    )
+
+    df["October Rating"] = df["October Rating"].str.strip()
+
+    # Tapes read with a declared schema arrive as categoricals already, their
+    # categories are re-sorted so tables come out in the same order either way
+    for column in CATEGORICAL_COLUMNS:
+        values = df[column].astype("category").cat.remove_unused_categories()
+        df[column] = values.cat.reorder_categories(
+            sorted(values.cat.categories)
+        )
+
+    return df
+
+
+def bucket_loan_tape(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add a column for every spec in BIN_SPECS. The buckets are ordered
+    categoricals so they sort in bin order rather than by label
+    """
+    df = df.copy(deep=False)
+    for spec in BIN_SPECS:
+        df[spec.name] = spec.assign(df[spec.source])
+
+    return df
+
+
+def bucket_dtypes() -> Dict[str, pd.CategoricalDtype]:
+    """
+    The ordered categorical dtype of every bucket column, for rebuilding
+    bucket columns that have been through a concat or round trip as strings
+    """
+    return {spec.name: spec.dtype for spec in BIN_SPECS}
@@ -0,0 +1,79 @@
+import pandas as pd
+
+from problem_c.cleaning import (
+    COUNTRY_INITIALS_MAPPING,
+    CATEGORICAL_COLUMNS,
+    bucket_loan_tape,
+    clean_loan_tape,
+    memory_usage,
+)
+
+
+def _raw_tape() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "Country": "fr",
+                "Status": "Ongoing",
+                "October Rating": "A ",
+                "Annual rate": 0.05,
+                "initial duration": 12,
+            },
+            {
+                "Country": "de",
+                "Status": "Loss",
+                "October Rating": " B+",
+                "Annual rate": 7.5,
+                "initial duration": 40,
+            },
+            {
+                "Country": "fr",
+                "Status": "Ongoing",
+                "October Rating": "C-",
+                "Annual rate": 0.1,
+                "initial duration": 81,
+            },
+        ]
+    )
+
+
+def test_clean_loan_tape__matches_row_wise() -> None:
+    raw = _raw_tape()
+
+    cleaned = clean_loan_tape(raw)
+
+    assert list(cleaned["Country"]) == [
+        COUNTRY_INITIALS_MAPPING[val] for val in raw["Country"]
+    ]
+    assert list(cleaned["Annual rate"]) == [
+        val / 100 if val > 0.1 else val for val in raw["Annual rate"]
+    ]
+    assert list(cleaned["October Rating"]) == [
+        val.strip() for val in raw["October Rating"]
+    ]
+    assert all(
+        isinstance(cleaned[column].dtype, pd.CategoricalDtype)
+        for column in CATEGORICAL_COLUMNS
+    )
+    assert raw["Country"][0] == "fr"
+
+
+def test_bucket_loan_tape__repeatable() -> None:
+    cleaned = clean_loan_tape(_raw_tape())
+
+    first = bucket_loan_tape(cleaned)
+    second = bucket_loan_tape(cleaned)
+
+    assert list(first["Initial duration type"]) == [
+        "10-20 years",
+        "30-40 years",
+        "80+ years",
+    ]
+    assert list(first["Annual rate bucket"]) == ["4% - 5%", "7% - 8%", ">9%"]
+    assert first.equals(second)
+
+
+def test_memory_usage__categoricals_shrink() -> None:
+    raw = pd.concat([_raw_tape()] * 1_000, ignore_index=True)
+
+    assert memory_usage(clean_loan_tape(raw)) < memory_usage(raw)
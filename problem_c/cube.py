@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from typing import List, Sequence
+
+from problem_c.aggregation import COUNT, summarise_weighted, weighted_sums
+from problem_c.stratification import (
+    CAPITAL,
+    RATE,
+    Dimensions,
+    merge_sums,
+    stratification_tables,
+    table_dimensions,
+)
+
+
+def cube_dimensions() -> Dimensions:
+    """
+    Every dimension used by any of the tables, in the order they first appear
+    """
+    dims: List[str] = []
+    for table_dims in table_dimensions():
+        dims.extend(dim for dim in table_dims if dim not in dims)
+
+    return tuple(dims)
+
+
+class StratificationCube:
+    """
+    Capital, rate x capital and loan counts aggregated once at the finest
+    grain across all the stratification dimensions. The cube only has a cell
+    per observed combination of keys so it stays small however many loans are
+    in the tape, and any stratification over a subset of the dimensions is a
+    cheap roll up of the cube rather than another pass over the loans.
+
+    Cubes over the same dimensions can be merged, which is how chunks of a
+    streamed tape are combined
+    """
+
+    dimensions: Dimensions
+    cells: pd.DataFrame
+    total_capital: float
+    rows: int
+
+    def __init__(
+        self,
+        cells: pd.DataFrame,
+        total_capital: float = 0.0,
+        rows: int = 0,
+    ) -> None:
+        self.dimensions = tuple(cells.index.names)
+        self.cells = cells
+        self.total_capital = total_capital
+        self.rows = rows
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        dimensions: Sequence[str] = (),
+    ) -> StratificationCube:
+        """
+        Build the cube of a cleaned and bucketed frame. Loans missing one of
+        the keys keep their own cell so they still count towards the totals of
+        the other dimensions
+        """
+        dims = list(dimensions or cube_dimensions())
+        return cls(
+            weighted_sums(df, RATE, CAPITAL, dims, dropna=False),
+            total_capital=float(df[CAPITAL].sum()),
+            rows=len(df.index),
+        )
+
+    def merge(self, other: StratificationCube) -> StratificationCube:
+        if self.dimensions != other.dimensions:
+            raise ValueError(
+                f"Can't merge cubes over {self.dimensions} and "
+                f"{other.dimensions}"
+            )
+
+        return StratificationCube(
+            merge_sums([self.cells, other.cells]),
+            total_capital=self.total_capital + other.total_capital,
+            rows=self.rows + other.rows,
+        )
+
+    def remove(self, other: StratificationCube) -> StratificationCube:
+        """
+        Take the loans aggregated in other back out of this cube. Cells left
+        without any loans are dropped so they don't linger in the tables.
+
+        The cube only knows how many loans each cell holds, not which ones,
+        so the only mistake it can catch is taking more loans out of a cell
+        than it holds. Callers that need to reject loans that were never
+        added have to track the loan ids themselves
+        """
+        if self.dimensions != other.dimensions:
+            raise ValueError(
+                f"Can't remove a cube over {other.dimensions} from one over "
+                f"{self.dimensions}"
+            )
+
+        cells = merge_sums([self.cells, -other.cells])
+        if (cells[COUNT] < 0).any():
+            raise ValueError("Can't remove more loans than a cell holds")
+
+        return StratificationCube(
+            cells[cells[COUNT] != 0],
+            total_capital=self.total_capital - other.total_capital,
+            rows=self.rows - other.rows,
+        )
+
+    def rollup(self, dimensions: Sequence[str]) -> pd.DataFrame:
+        """
+        Partial sums over a subset of the cube dimensions, dropping loans
+        missing any of the requested keys like a groupby over the loans would
+        """
+        missing = [dim for dim in dimensions if dim not in self.dimensions]
+        if missing:
+            raise KeyError(f"{missing} are not dimensions of this cube")
+
+        return self.cells.groupby(
+            level=list(dimensions), observed=True, sort=True
+        ).sum()
+
+    def weighted_aggregate(self, dimensions: Sequence[str]) -> pd.DataFrame:
+        return summarise_weighted(self.rollup(dimensions))
+
+    def tables(self) -> List[pd.DataFrame]:
+        return stratification_tables(
+            {dims: self.rollup(dims) for dims in table_dimensions()},
+            self.total_capital,
+        )
@@ -0,0 +1,71 @@
+import pytest
+import pandas as pd
+
+from problem_c.aggregation import COUNT, WEIGHT, weighted_sums
+from problem_c.cleaning import bucket_loan_tape, clean_loan_tape
+from problem_c.cube import StratificationCube
+
+
+def _tape() -> pd.DataFrame:
+    return bucket_loan_tape(
+        clean_loan_tape(
+            pd.DataFrame(
+                {
+                    "October Rating": ["A", "B ", "A", "C", "B"],
+                    "Annual rate": [0.05, 6.0, 0.0, 0.03, 0.05],
+                    "initial duration": [12, 24, 36, 48, 12],
+                    "Status": ["Ongoing", "Loss", "Ongoing", "Loss", "Loss"],
+                    "Remaining capital": [100.0, 200.0, 300.0, 0.0, 50.0],
+                    "Country": ["fr", "fr", "it", "de", "it"],
+                }
+            )
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "dimensions",
+    [
+        (["Country"]),
+        (["Annual rate bucket"]),
+        (["Initial duration type", "October Rating"]),
+        (["Country", "Status"]),
+    ],
+)
+def test_rollup__matches_groupby(dimensions) -> None:
+    df = _tape()
+
+    rollup = StratificationCube.from_frame(df).rollup(dimensions)
+    expected = weighted_sums(
+        df, "Annual rate", "Remaining capital", dimensions
+    )
+
+    assert list(rollup.index) == list(expected.index)
+    assert rollup.values == pytest.approx(expected.values)
+
+
+def test_rollup__missing_keys_kept_in_totals() -> None:
+    # A zero rate falls outside the first rate bucket
+    cube = StratificationCube.from_frame(_tape())
+
+    assert cube.rollup(["Country"])[WEIGHT].sum() == cube.total_capital
+    assert cube.rollup(["Annual rate bucket"])[COUNT].sum() == 4
+
+
+def test_merge__matches_whole_frame() -> None:
+    df = _tape()
+
+    merged = StratificationCube.from_frame(df.iloc[:2]).merge(
+        StratificationCube.from_frame(df.iloc[2:])
+    )
+    whole = StratificationCube.from_frame(df)
+
+    assert merged.rows == whole.rows == 5
+    for merged_table, whole_table in zip(merged.tables(), whole.tables()):
+        assert list(merged_table.index) == list(whole_table.index)
+        assert merged_table.values == pytest.approx(whole_table.values)
+
+
+def test_rollup__unknown_dimension() -> None:
+    with pytest.raises(KeyError):
+        StratificationCube.from_frame(_tape()).rollup(["Loan id"])
@@ -1,9 +1,34 @@
 from __future__ import annotations
-from operator import index
 
 import pandas as pd
+
 from rich.table import Table
-from typing import Optional
+from typing import Dict, List, Optional
+
+
+def format_column(
+    series: pd.Series,
+    float_rounding: int = 4,
+    format_spec: Optional[str] = None,
+) -> List[str]:
+    """
+    Format a whole column to strings at once. A format spec (e.g. ".2%") is
+    applied to every value, otherwise floats are rounded and everything else,
+    numpy scalars and categoricals included, is converted as str would. The
+    conversion is a single numpy cast of the column rather than a Python
+    call per value
+    """
+    if format_spec is not None:
+        return series.map(f"{{:{format_spec}}}".format).tolist()
+
+    if pd.api.types.is_float_dtype(series.dtype):
+        # Widen first so float32 values don't pick up representation noise
+        rounded = series.astype("float64").round(float_rounding)
+        return rounded.to_numpy().astype(str).tolist()
+
+    # Going through object keeps nullable ints as ints and missing values as
+    # they print, where a direct cast would turn them into floats
+    return series.astype(object).to_numpy().astype(str).tolist()
 
 
 def dataframe_to_rich_table(
@@ -11,46 +36,41 @@ def dataframe_to_rich_table(
     limit: Optional[int] = None,
     add_index: bool = True,
     float_rounding: int = 4,
-):
-    # If limit not given then just print all rows
-    if not limit:
-        limit = len(df.index)
+    formats: Optional[Dict[str, str]] = None,
+) -> Table:
+    """
+    Render a frame as a rich table. Rows past the limit are sliced off before
+    anything is formatted and formats maps column or index names to format
+    specs for the columns that need something other than rounding
+    """
+    formats = formats or {}
 
-    # We need to work with the indexes given, which might be greater
-    # than one
-    if df.index.names:
-        index_names = list(df.index.names)
-    else:
-        index_names = [df.index.name]
+    # If limit not given then just print all rows
+    if limit:
+        df = df.iloc[:limit]
 
     table = Table()
+    columns: List[List[str]] = []
+
     if add_index:
-        for name in index_names:
-            table.add_column(name)
+        # We need to work with the indexes given, which might be greater
+        # than one
+        for level, name in enumerate(df.index.names):
+            values = df.index.get_level_values(level).to_series()
+            table.add_column("" if name is None else str(name))
+            columns.append(
+                format_column(values, float_rounding, formats.get(name))
+            )
 
     for column_name in df.columns:
-        table.add_column(column_name.capitalize())
-
-    count = 0
-    for idx, row in df.iterrows():
-        if count > limit:
-            break
-        str_row = []
-        if add_index:
-            if len(index_names) > 1:
-                str_row.extend(idx)
-            else:
-                str_row.append(idx)
-        for val in row:
-            if isinstance(val, str):
-                str_row.append(val)
-            elif isinstance(val, float):
-                str_row.append(str(round(val, float_rounding)))
-            elif isinstance(val, int):
-                str_row.append(str(val))
-            else:
-                raise TypeError(f"No unstructuring strategy for {val}")
+        table.add_column(str(column_name).capitalize())
+        columns.append(
+            format_column(
+                df[column_name], float_rounding, formats.get(column_name)
+            )
+        )
+
+    for str_row in zip(*columns):
         table.add_row(*str_row)
-        count += 1
 
     return table
@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from rich.table import Table
+
+from problem_c.df_to_rich import dataframe_to_rich_table
+from problem_c.export import export_tables
+
+
+def _cells(table: Table) -> list:
+    return [list(column.cells) for column in table.columns]
+
+
+def test_dataframe_to_rich_table__limit() -> None:
+    df = pd.DataFrame({"val": range(10)})
+
+    table = dataframe_to_rich_table(df, limit=3)
+
+    assert table.row_count == 3
+    assert dataframe_to_rich_table(df).row_count == 10
+
+
+def test_dataframe_to_rich_table__numpy_types() -> None:
+    df = pd.DataFrame(
+        {
+            "count": np.array([1, 2], dtype=np.int64),
+            "share": np.array([0.123456, 0.5], dtype=np.float32),
+            "rating": pd.Categorical(["A", "B"]),
+        },
+        index=pd.MultiIndex.from_tuples(
+            [("foo", "bar"), ("foo", "baz")], names=["cat_1", "cat_2"]
+        ),
+    )
+
+    table = dataframe_to_rich_table(df, formats={"count": "03d"})
+
+    assert [column.header for column in table.columns] == [
+        "cat_1",
+        "cat_2",
+        "Count",
+        "Share",
+        "Rating",
+    ]
+    assert _cells(table) == [
+        ["foo", "foo"],
+        ["bar", "baz"],
+        ["001", "002"],
+        ["0.1235", "0.5"],
+        ["A", "B"],
+    ]
+
+
+def test_export_tables(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {"Remaining capital": [0.25, 0.75]},
+        index=pd.Index(["A", "B"], name="October Rating"),
+    )
+
+    (path,) = export_tables([df], tmp_path, "csv")
+
+    assert path.name == "october_rating--remaining_capital.csv"
+    pd.testing.assert_frame_equal(pd.read_csv(path, index_col=0), df)
+
+
+def test_export_tables__same_dimensions(tmp_path: Path) -> None:
+    index = pd.Index(["A", "B"], name="October Rating")
+    shares = pd.DataFrame({"Remaining capital": [0.25, 0.75]}, index=index)
+    rates = pd.DataFrame({"Weighted mean": [0.05, 0.07]}, index=index)
+
+    paths = export_tables([shares, rates], tmp_path, "csv")
+    assert len(set(paths)) == 2
+
+    with pytest.raises(ValueError):
+        export_tables([rates, shares, shares], tmp_path / "clash", "csv")
+    assert not (tmp_path / "clash").exists()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import re
+import pandas as pd
+
+from pathlib import Path
+from typing import List
+
+EXPORT_FORMATS = ("csv", "json", "html")
+
+
+def export_dataframe(
+    df: pd.DataFrame, path: Path, export_format: str = ""
+) -> None:
+    """
+    Write a table straight to CSV, JSON or HTML without going through rich.
+    The format is taken from the file extension unless given, and values are
+    written at full precision for whatever reads them next
+    """
+    export_format = export_format or path.suffix.lstrip(".")
+    if export_format == "csv":
+        df.to_csv(path)
+    elif export_format == "json":
+        df.reset_index().to_json(path, orient="records", indent=2)
+    elif export_format == "html":
+        df.to_html(path)
+    else:
+        raise ValueError(f"Unsupported export format {export_format}")
+
+
+def _slug(names: List[str]) -> str:
+    return "-".join(
+        re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_") for name in names
+    )
+
+
+def table_file_name(df: pd.DataFrame, export_format: str) -> str:
+    """
+    File name for a table built from its index names followed by its column
+    names, so tables over the same dimensions don't share a name, e.g.
+    initial_duration_type-october_rating--remaining_capital.csv
+    """
+    index_names = [str(name) for name in df.index.names if name is not None]
+    stem = "--".join(
+        part
+        for part in (
+            _slug(index_names),
+            _slug([str(name) for name in df.columns]),
+        )
+        if part
+    )
+    return f"{stem or 'table'}.{export_format}"
+
+
+def export_tables(
+    tables: List[pd.DataFrame], directory: Path, export_format: str = "csv"
+) -> List[Path]:
+    # Check every name before writing so a clash never leaves half the
+    # tables on disk
+    paths = [
+        directory / table_file_name(table, export_format) for table in tables
+    ]
+    duplicates = sorted({path.name for path in paths if paths.count(path) > 1})
+    if duplicates:
+        raise ValueError(
+            f"More than one table would be exported to {duplicates}"
+        )
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for table, path in zip(tables, paths):
+        export_dataframe(table, path, export_format)
+
+    return paths
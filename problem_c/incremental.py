@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import pandas as pd
+
+from contextlib import closing, contextmanager
+from pathlib import Path
+from rich.console import Console
+from rich.columns import Columns
+from typer import Typer, Argument
+from typing import Iterator, List, Optional, Tuple
+
+from problem_c.cache import load_loan_tape
+from problem_c.cleaning import CLEANING_VERSION, bucket_loan_tape
+from problem_c.cube import StratificationCube
+from problem_c.df_to_rich import dataframe_to_rich_table
+
+BOOK_TABLE = "book"
+LOAN_IDS_TABLE = "loan_ids"
+
+app = Typer()
+
+
+def batch_cube(df: pd.DataFrame) -> StratificationCube:
+    """
+    The cube of a cleaned batch of loans, bucketing only the batch
+    """
+    return StratificationCube.from_frame(bucket_loan_tape(df))
+
+
+def _batch_loan_ids(df: pd.DataFrame) -> List[Tuple[str]]:
+    if "Loan id" not in df.columns:
+        raise ValueError("Batches need a Loan id column to update the book")
+
+    ids = df["Loan id"].astype(str)
+    if ids.duplicated().any():
+        raise ValueError("A batch can't hold the same loan twice")
+
+    return [(loan_id,) for loan_id in ids]
+
+
+class IncrementalStratification:
+    """
+    A stratification cube of the whole book, persisted in a SQLite file,
+    that batches of loans are added to or removed from. Updating costs a pass
+    over the batch plus a merge with the cube, which only has a cell per
+    observed key, so a day's new loans never mean going back over the
+    millions already in the book.
+
+    The ids of the loans in the book live in an indexed table next to the
+    cube so a loan can't be added twice or removed without having been
+    added. An update only looks up, inserts or deletes the batch's own ids,
+    and commits them together with the new cube
+    """
+
+    path: Path
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+        with self._connect() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {BOOK_TABLE} "
+                f"(cleaning_version INTEGER, cube BLOB)"
+            )
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {LOAN_IDS_TABLE} "
+                f'("Loan id" TEXT PRIMARY KEY) WITHOUT ROWID'
+            )
+            row = conn.execute(
+                f"SELECT cleaning_version FROM {BOOK_TABLE}"
+            ).fetchone()
+
+        if row is not None and row[0] != CLEANING_VERSION:
+            raise ValueError(
+                f"{path} was built with cleaning version {row[0]}, rebuild "
+                f"it from the full book"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # The connection's own context manager only commits, so close it too
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            yield conn
+
+    @staticmethod
+    def _read_cube(conn: sqlite3.Connection) -> Optional[StratificationCube]:
+        row = conn.execute(f"SELECT cube FROM {BOOK_TABLE}").fetchone()
+        return None if row is None else pickle.loads(row[0])
+
+    @staticmethod
+    def _write_cube(
+        conn: sqlite3.Connection, cube: StratificationCube
+    ) -> None:
+        conn.execute(f"DELETE FROM {BOOK_TABLE}")
+        conn.execute(
+            f"INSERT INTO {BOOK_TABLE} VALUES (?, ?)",
+            (CLEANING_VERSION, pickle.dumps(cube)),
+        )
+
+    @property
+    def cube(self) -> Optional[StratificationCube]:
+        with self._connect() as conn:
+            return self._read_cube(conn)
+
+    def add(self, df: pd.DataFrame) -> None:
+        ids = _batch_loan_ids(df)
+        batch = batch_cube(df)
+
+        # Leaving the block on an error rolls back the ids inserted so far
+        with self._connect() as conn:
+            try:
+                conn.executemany(
+                    f"INSERT INTO {LOAN_IDS_TABLE} VALUES (?)", ids
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError(
+                    "Can't add loans that are already in the book"
+                ) from None
+
+            cube = self._read_cube(conn)
+            self._write_cube(
+                conn, batch if cube is None else cube.merge(batch)
+            )
+
+    def remove(self, df: pd.DataFrame) -> None:
+        """
+        Take a batch of loans back out of the book. The batch has to carry
+        the same values the loans were added with, the loan ids only prove
+        the loans are in the book and the cube can't tell which cell each
+        of them was counted in
+        """
+        ids = _batch_loan_ids(df)
+        batch = batch_cube(df)
+
+        with self._connect() as conn:
+            cube = self._read_cube(conn)
+            if cube is None:
+                raise ValueError("Can't remove loans from an empty book")
+
+            deleted = conn.executemany(
+                f'DELETE FROM {LOAN_IDS_TABLE} WHERE "Loan id" = ?', ids
+            ).rowcount
+            if deleted != len(ids):
+                raise ValueError("Can't remove loans that were never added")
+
+            self._write_cube(conn, cube.remove(batch))
+
+    def tables(self) -> List[pd.DataFrame]:
+        cube = self.cube
+        if cube is None:
+            raise ValueError("No loans have been added yet")
+
+        return cube.tables()
+
+
+def _update(state_path: str, file_path: str, remove: bool) -> None:
+    console = Console()
+
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError("File does not exist")
+
+    state = IncrementalStratification(Path(state_path))
+    batch = load_loan_tape(path, use_cache=False)
+    if remove:
+        state.remove(batch)
+    else:
+        state.add(batch)
+
+    cube = state.cube
+    rows = cube.rows if cube else 0
+    console.print(
+        f"{'Removed' if remove else 'Added'} {len(batch.index)} loans, "
+        f"{rows} loans in the book"
+    )
+
+
+@app.command("add")
+def add_command(
+    state_path: str = Argument(None), file_path: str = Argument(None)
+) -> None:
+    _update(state_path, file_path, remove=False)
+
+
+@app.command("remove")
+def remove_command(
+    state_path: str = Argument(None), file_path: str = Argument(None)
+) -> None:
+    _update(state_path, file_path, remove=True)
+
+
+@app.command("show")
+def show_command(state_path: str = Argument(None)) -> None:
+    console = Console()
+
+    path = Path(state_path)
+    if not path.exists():
+        raise FileNotFoundError("State file does not exist")
+
+    strat_columns = Columns(padding=1)
+    for table in IncrementalStratification(path).tables():
+        strat_columns.add_renderable(dataframe_to_rich_table(table))
+
+    console.print(strat_columns)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,73 @@
+import pytest
+import pandas as pd
+
+from pathlib import Path
+
+from problem_c.cleaning import clean_loan_tape
+from problem_c.incremental import IncrementalStratification, batch_cube
+from problem_c.synthetic import generate_loan_tape
+
+
+def _assert_same_tables(first, second) -> None:
+    for first_table, second_table in zip(first, second):
+        assert list(first_table.index) == list(second_table.index)
+        assert first_table.values == pytest.approx(second_table.values)
+
+
+def test_add__matches_whole_book(tmp_path: Path) -> None:
+    book = clean_loan_tape(generate_loan_tape(500))
+    path = tmp_path / "book.sqlite"
+
+    IncrementalStratification(path).add(book.iloc[:400])
+
+    state = IncrementalStratification(path)
+    state.add(book.iloc[400:])
+
+    assert state.cube is not None
+    assert state.cube.rows == 500
+    _assert_same_tables(state.tables(), batch_cube(book).tables())
+
+
+def test_remove__matches_remaining_book(tmp_path: Path) -> None:
+    book = clean_loan_tape(generate_loan_tape(500))
+
+    state = IncrementalStratification(tmp_path / "book.sqlite")
+    state.add(book)
+    state.remove(book.iloc[:100])
+
+    assert state.cube is not None
+    assert state.cube.rows == 400
+    _assert_same_tables(state.tables(), batch_cube(book.iloc[100:]).tables())
+
+
+def test_remove__unknown_loans(tmp_path: Path) -> None:
+    book = clean_loan_tape(generate_loan_tape(500))
+    state = IncrementalStratification(tmp_path / "book.sqlite")
+    state.add(book)
+
+    # The same loans under ids that were never added land in cells the book
+    # already has, so only the loan ids can tell them apart
+    unknown = book.iloc[:3].copy()
+    unknown["Loan id"] = ["never-added-1", "never-added-2", "never-added-3"]
+
+    with pytest.raises(ValueError):
+        state.remove(pd.concat([book.iloc[3:5], unknown]))
+
+    # The known loans in the rejected batch are still in the book
+    state.remove(book.iloc[3:5])
+    assert state.cube is not None
+    assert state.cube.rows == 498
+
+
+def test_add__loans_already_in_book(tmp_path: Path) -> None:
+    book = clean_loan_tape(generate_loan_tape(100))
+    state = IncrementalStratification(tmp_path / "book.sqlite")
+    state.add(book.iloc[:90])
+
+    with pytest.raises(ValueError):
+        state.add(book.iloc[80:])
+
+    # None of the rejected batch was added, new loans included
+    state.add(book.iloc[90:])
+    assert state.cube is not None
+    assert state.cube.rows == 100
@@ -5,85 +5,15 @@ import pandas as pd
 from pathlib import Path
 from rich.console import Console
 from rich.columns import Columns
-from typing import Callable, Dict, List, Tuple
+from typing import Dict, List, Optional
 
+from problem_c.cache import LoanTapeCache
+from problem_c.cleaning import bucket_loan_tape, memory_usage
+from problem_c.cube import StratificationCube
 from problem_c.df_to_rich import dataframe_to_rich_table
+from problem_c.schema import memory_report
 
-
-COUNTRY_INITIALS_MAPPING = {
-    "de": "Germany",
-    "es": "Spain",
-    "fr": "France",
-    "it": "Italy",
-    "nl": "Netherlands",
-}
-
-BIN_MAPPINGS = {
-    "initial duration": dict(
-        name="Initial duration type",
-        bins=[0.0, 10.0, 20.0, 30.0, 40.0, 50, 60, 70, 80, float("inf")],
-        labels=[
-            "<10 years",
-            "10-20 years",
-            "20-30 years",
-            "30-40 years",
-            "40-50 years",
-            "50-60 years",
-            "60-70 years",
-            "70-80 years",
-            "80+ years",
-        ],
-    ),
-    "Annual rate": dict(
-        name="Annual rate bucket",
-        bins=[
-            0.0,
-            0.02,
-            0.03,
-            0.04,
-            0.05,
-            0.06,
-            0.07,
-            0.08,
-            0.09,
-            float("inf"),
-        ],
-        labels=[
-            "<2%",
-            "2% - 3%",
-            "3% - 4%",
-            "4% - 5%",
-            "5% - 6%",
-            "6% - 7%",
-            "7% - 8%",
-            "8% - 9%",
-            ">9%",
-        ],
-    ),
-}
-
-# TABLE MAPPING
-STRATIFICATIONS = [
-    "October Rating",
-    "Country",
-    "Status",
-    "Initial duration type",
-    "Annual rate bucket",
-]
-
-
-def annual_rate_weighted_average_row_calc(
-    totals_mappings: Dict[Tuple[str, str], Dict[str, float]]
-) -> Callable[[pd.Series], float]:
-    def row_calculation(row: pd.Series) -> float:
-        group_total = totals_mappings[
-            (row["Initial duration type"], row["October Rating"])
-        ]["Remaining capital"]
-        if group_total == 0:
-            return 0
-        return row["Annual rate"] * row["Remaining capital"] / group_total
-
-    return row_calculation
+DEFAULT_INPUT_PATH = Path("problem_c") / "input" / "data.xlsx"
 
 
 def group_by_categories(
@@ -94,78 +24,63 @@ def group_by_categories(
     return (df.groupby(categories).sum()).to_dict(**to_dict_kwargs)
 
 
-def problem_c() -> None:
+def problem_c(
+    path: Path = DEFAULT_INPUT_PATH,
+    *,
+    stream: bool = False,
+    chunksize: Optional[int] = None,
+    export_dir: Optional[Path] = None,
+    export_format: str = "csv",
+    show_memory: bool = False,
+    sqlite_path: Optional[Path] = None,
+) -> None:
+    """
+    Print the stratification tables for a loan tape. Spreadsheets are loaded
+    whole through the cache, with stream set a CSV tape is aggregated chunk by
+    chunk instead so it never has to fit in memory. Given an export_dir the
+    tables are written there as CSV, JSON or HTML instead of being printed.
+    show_memory prints the footprint of every column of the working set.
+    Given a sqlite_path the tape is ingested there once and the tables are
+    answered by queries against it from then on
+    """
     console = Console()
-    path = Path("problem_c") / "input" / "data.xlsx"
-    df = pd.read_excel(path)
 
-    # DATA CLEAN UP
-    # Add country names
-    df["Country"] = df["Country"].apply(lambda x: COUNTRY_INITIALS_MAPPING[x])
+    # The other backends are only imported by the runs that use them
+    if sqlite_path is not None:
+        from problem_c.sqlite_backend import open_sqlite_tape
+
+        tables = open_sqlite_tape(path, sqlite_path).tables()
+    elif stream:
+        from problem_c.streaming import aggregate_csv
+
+        cube = aggregate_csv(path, chunksize)
+        console.print(f"Streamed {cube.rows} loans from {path.name}")
+        tables = cube.tables()
+    else:
+        tape_cache = LoanTapeCache(path)
+        df = bucket_loan_tape(tape_cache.load())
+
+        console.print(
+            f"Loan tape memory: {(tape_cache.raw_memory or 0) / 1e6:.2f}MB "
+            f"raw, {memory_usage(df) / 1e6:.2f}MB cleaned"
+            f"{' (cached)' if tape_cache.hit else ''}"
+        )
+        if show_memory:
+            console.print(dataframe_to_rich_table(memory_report(df)))
 
-    # Normalise mistyped rates
-    df["Annual rate"] = df["Annual rate"].apply(
-        lambda x: x / 100 if x > 0.1 else x
-    )
+        tables = StratificationCube.from_frame(df).tables()
 
-    # Normalise credit ratings and strip whitespace
-    df["October Rating"] = df["October Rating"].apply(lambda x: x.strip())
+    if export_dir is not None:
+        from problem_c.export import export_tables
 
-    total_remaining = df["Remaining capital"].sum()
+        for table_path in export_tables(tables, export_dir, export_format):
+            console.print(f"Wrote {table_path}")
+        return
 
     strat_columns = Columns(padding=1)
+    for table in tables:
+        strat_columns.add_renderable(dataframe_to_rich_table(table))
 
-    # Create the bins we need for histograms
-    for strat, cut_config in BIN_MAPPINGS.items():
-        cut = cut_config.pop("name")
-        df[cut] = pd.cut(df[strat], **cut_config)
-
-    # Basic table creatation of enum like data
-    for strat in STRATIFICATIONS:
-        strat_df = (
-            df[[strat, "Remaining capital"]]
-            .set_index(strat)
-            .groupby([strat])
-            .sum()
-            / total_remaining
-        )
-        strat_columns.add_renderable(dataframe_to_rich_table(strat_df))
-
-    # This loop is for all of the buckets we want to cut our data up by
-
-    # Final grouping for multiple grouping
-    capital_grouping = (
-        df[
-            [
-                "Initial duration type",
-                "October Rating",
-                "Remaining capital",
-            ]
-        ]
-        .groupby(["Initial duration type", "October Rating"])
-        .sum()
-    ).to_dict(orient="index")
-
-    # Calculate the weighted average annual return for each row
-    df["Weighted Avg Annual Return"] = df.apply(
-        annual_rate_weighted_average_row_calc(capital_grouping), axis=1
-    )
-
-    # Group by "Initial duration" and "October Rating" and calculate the
-    # weighted average annual return
-    grouped = (
-        df[
-            [
-                "Initial duration type",
-                "October Rating",
-                "Weighted Avg Annual Return",
-            ]
-        ]
-        .groupby(["Initial duration type", "October Rating"])
-        .sum()
-    )
-
-    strat_columns.add_renderable(dataframe_to_rich_table(grouped))
     console.print(strat_columns)
 
 
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+# Declared dtypes of the loan tape columns the pipeline reads.
+#
+# The repeated strings are categoricals and the duration in months fits a
+# nullable 16 bit int. The rate stays at 64 bits as float32 moves values like
+# 0.05 across the bucket edges, and so does the capital as it is summed over
+# millions of loans
+LOAN_TAPE_SCHEMA: Dict[str, str] = {
+    "Loan id": "string",
+    "October Rating": "category",
+    "Annual rate": "float64",
+    "initial duration": "Int16",
+    "Status": "category",
+    "Remaining capital": "float64",
+    "Country": "category",
+}
+
+TAPE_COLUMNS = list(LOAN_TAPE_SCHEMA)
+
+
+def read_loan_tape(
+    path: Path, columns: Optional[Sequence[str]] = TAPE_COLUMNS
+) -> pd.DataFrame:
+    """
+    Read a raw loan tape, dispatching on the file extension. Only the
+    requested columns are read, typed as declared in LOAN_TAPE_SCHEMA, and
+    columns the tape doesn't have are skipped. Pass columns=None for every
+    column with inferred types
+    """
+    usecols = None if columns is None else set(columns).__contains__
+    dtype = None
+    if columns is not None:
+        dtype = {
+            column: LOAN_TAPE_SCHEMA[column]
+            for column in columns
+            if column in LOAN_TAPE_SCHEMA
+        }
+
+    if path.suffix in (".xlsx", ".xls"):
+        df = pd.read_excel(path, usecols=usecols)
+        if dtype:
+            df = df.astype(
+                {col: typ for col, typ in dtype.items() if col in df.columns}
+            )
+        return df
+    if path.suffix == ".csv":
+        return pd.read_csv(path, usecols=usecols, dtype=dtype)
+
+    raise ValueError(f"Unsupported loan tape format {path.suffix}")
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Bytes held by each column, including the strings behind object columns,
+    along with its dtype and share of the whole frame
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    report = pd.DataFrame(
+        {
+            "Dtype": [str(df[column].dtype) for column in usage.index],
+            "Bytes": usage.astype(int),
+            "Share": usage / usage.sum() if usage.sum() else 0.0,
+        },
+        index=usage.index,
+    )
+    report.index.name = "Column"
+    return report
@@ -0,0 +1,32 @@
+import pytest
+import pandas as pd
+
+from pathlib import Path
+
+from problem_c.cleaning import clean_loan_tape
+from problem_c.schema import memory_report, read_loan_tape
+from problem_c.synthetic import generate_loan_tape
+
+
+def test_read_loan_tape__typed_columns(tmp_path: Path) -> None:
+    path = tmp_path / "tape.csv"
+    generate_loan_tape(100).assign(Extra="unused").to_csv(path, index=False)
+
+    df = read_loan_tape(path)
+
+    assert "Extra" not in df.columns
+    assert str(df["initial duration"].dtype) == "Int16"
+    assert isinstance(df["Country"].dtype, pd.CategoricalDtype)
+    assert "Extra" in read_loan_tape(path, columns=None).columns
+
+
+def test_memory_report() -> None:
+    df = clean_loan_tape(generate_loan_tape(100))
+
+    report = memory_report(df)
+
+    assert list(report.index) == list(df.columns)
+    assert (
+        report["Bytes"].sum() == df.memory_usage(deep=True, index=False).sum()
+    )
+    assert report["Share"].sum() == pytest.approx(1.0)
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import sqlite3
+import pandas as pd
+
+from contextlib import closing, contextmanager
+from pathlib import Path
+from rich.console import Console
+from rich.columns import Columns
+from typer import Typer, Argument
+from typing import Iterator, List, Optional, Sequence
+
+from problem_c.aggregation import (
+    COUNT,
+    WEIGHT,
+    WEIGHTED_VALUE,
+    summarise_weighted,
+)
+from problem_c.cache import load_loan_tape
+from problem_c.cleaning import (
+    CLEANING_VERSION,
+    bucket_dtypes,
+    bucket_loan_tape,
+)
+from problem_c.cube import cube_dimensions
+from problem_c.df_to_rich import dataframe_to_rich_table
+from problem_c.stratification import (
+    CAPITAL,
+    RATE,
+    stratification_tables,
+    table_dimensions,
+)
+
+LOANS_TABLE = "loans"
+METADATA_TABLE = "tape_metadata"
+
+app = Typer()
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SqliteLoanTape:
+    """
+    A cleaned loan tape held in a local SQLite file so new stratifications
+    can be answered without loading the spreadsheet again.
+
+    Every stratification column gets an index covering the capital and rate,
+    so grouped sums are read straight from the index rather than the table.
+    Queries hand back the same partial sums as StratificationCube.rollup and
+    the tables are finished by the same code
+    """
+
+    path: Path
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # The connection's own context manager only commits, so close it too
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            yield conn
+
+    def source_matches(self, source: Path) -> bool:
+        """
+        Whether the database already holds this version of the tape
+        """
+        if not self.path.exists():
+            return False
+
+        stat = source.stat()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    f"SELECT source, size, mtime_ns, cleaning_version "
+                    f"FROM {METADATA_TABLE}"
+                ).fetchone()
+        except sqlite3.DatabaseError:
+            return False
+
+        return row == (
+            str(source.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            CLEANING_VERSION,
+        )
+
+    def ingest(self, df: pd.DataFrame, source: Optional[Path] = None) -> None:
+        """
+        Replace the loans in the database with a cleaned tape and build the
+        indexes used by the stratification queries
+        """
+        columns = [*cube_dimensions(), RATE, CAPITAL]
+        loans = bucket_loan_tape(df)[columns]
+        loans = loans.astype(
+            {
+                column: object
+                for column in columns
+                if isinstance(loans[column].dtype, pd.CategoricalDtype)
+            }
+        )
+
+        with self._connect() as conn:
+            conn.execute(f"DROP TABLE IF EXISTS {LOANS_TABLE}")
+            conn.execute(f"DROP TABLE IF EXISTS {METADATA_TABLE}")
+            loans.to_sql(LOANS_TABLE, conn, index=False, chunksize=100_000)
+
+            # Cover capital and rate too so the sums never touch the table
+            for idx, dims in enumerate(sorted(set(table_dimensions()))):
+                indexed = ", ".join(
+                    _quote(col) for col in (*dims, CAPITAL, RATE)
+                )
+                conn.execute(
+                    f"CREATE INDEX idx_{LOANS_TABLE}_{idx} "
+                    f"ON {LOANS_TABLE} ({indexed})"
+                )
+
+            conn.execute(
+                f"CREATE TABLE {METADATA_TABLE} (source TEXT, size INTEGER, "
+                f"mtime_ns INTEGER, cleaning_version INTEGER)"
+            )
+            if source is not None:
+                stat = source.stat()
+                conn.execute(
+                    f"INSERT INTO {METADATA_TABLE} VALUES (?, ?, ?, ?)",
+                    (
+                        str(source.resolve()),
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                        CLEANING_VERSION,
+                    ),
+                )
+
+    @property
+    def total_capital(self) -> float:
+        with self._connect() as conn:
+            (total,) = conn.execute(
+                f"SELECT TOTAL({_quote(CAPITAL)}) FROM {LOANS_TABLE}"
+            ).fetchone()
+
+        return float(total)
+
+    def rollup(self, dimensions: Sequence[str]) -> pd.DataFrame:
+        """
+        Sum of capital, rate x capital and loan count over the dimensions,
+        skipping loans missing any of them like a groupby would
+        """
+        missing = [dim for dim in dimensions if dim not in cube_dimensions()]
+        if missing:
+            raise KeyError(f"{missing} are not dimensions of this tape")
+
+        dims = ", ".join(_quote(dim) for dim in dimensions)
+        not_null = " AND ".join(
+            f"{_quote(dim)} IS NOT NULL" for dim in dimensions
+        )
+        sql = (
+            f"SELECT {dims}, "
+            f"TOTAL({_quote(CAPITAL)}) AS {_quote(WEIGHT)}, "
+            f"TOTAL({_quote(RATE)} * {_quote(CAPITAL)}) "
+            f"AS {_quote(WEIGHTED_VALUE)}, "
+            f"COUNT(*) AS {_quote(COUNT)} "
+            f"FROM {LOANS_TABLE} WHERE {not_null} GROUP BY {dims}"
+        )
+        with self._connect() as conn:
+            sums = pd.read_sql_query(sql, conn)
+
+        # Put the buckets back in bin order rather than label order
+        for column, dtype in bucket_dtypes().items():
+            if column in dimensions:
+                sums[column] = sums[column].astype(dtype)
+
+        return sums.set_index(list(dimensions)).sort_index()
+
+    def weighted_aggregate(self, dimensions: Sequence[str]) -> pd.DataFrame:
+        return summarise_weighted(self.rollup(dimensions))
+
+    def tables(self) -> List[pd.DataFrame]:
+        return stratification_tables(
+            {dims: self.rollup(dims) for dims in table_dimensions()},
+            self.total_capital,
+        )
+
+
+def open_sqlite_tape(tape_path: Path, db_path: Path) -> SqliteLoanTape:
+    """
+    The SQLite copy of a tape, ingesting it first if the database doesn't
+    hold this version of the tape yet
+    """
+    db = SqliteLoanTape(db_path)
+    if not db.source_matches(tape_path):
+        db.ingest(load_loan_tape(tape_path), tape_path)
+
+    return db
+
+
+@app.command("ingest")
+def ingest_command(
+    file_path: str = Argument(None), db_path: str = Argument(None)
+) -> None:
+    console = Console()
+
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError("File does not exist")
+
+    with console.status("[green]Ingesting tape ...[/green]", spinner="dots"):
+        SqliteLoanTape(Path(db_path)).ingest(load_loan_tape(path), path)
+
+    console.print(f"Ingested {path.name} into {db_path}")
+
+
+@app.command("query")
+def query_command(
+    db_path: str = Argument(None),
+    dimensions: Optional[List[str]] = Argument(None),
+) -> None:
+    console = Console()
+
+    path = Path(db_path)
+    if not path.exists():
+        raise FileNotFoundError("Database does not exist")
+
+    db = SqliteLoanTape(path)
+    if not dimensions:
+        strat_columns = Columns(padding=1)
+        for table in db.tables():
+            strat_columns.add_renderable(dataframe_to_rich_table(table))
+        console.print(strat_columns)
+        return
+
+    console.print(dataframe_to_rich_table(db.weighted_aggregate(dimensions)))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,53 @@
+import pytest
+
+from pathlib import Path
+
+from problem_c.cleaning import clean_loan_tape
+from problem_c.incremental import batch_cube
+from problem_c.sqlite_backend import SqliteLoanTape, open_sqlite_tape
+from problem_c.synthetic import generate_loan_tape
+
+
+def test_tables__match_cube(tmp_path: Path) -> None:
+    book = clean_loan_tape(generate_loan_tape(500))
+    db = SqliteLoanTape(tmp_path / "book.sqlite")
+    db.ingest(book)
+
+    for table, expected in zip(db.tables(), batch_cube(book).tables()):
+        assert list(table.index) == list(expected.index)
+        assert list(table.columns) == list(expected.columns)
+        assert table.values == pytest.approx(expected.values)
+
+
+def test_weighted_aggregate__ad_hoc_dimensions(tmp_path: Path) -> None:
+    book = clean_loan_tape(generate_loan_tape(500))
+    db = SqliteLoanTape(tmp_path / "book.sqlite")
+    db.ingest(book)
+
+    dims = ["Country", "Annual rate bucket"]
+    table = db.weighted_aggregate(dims)
+    expected = batch_cube(book).weighted_aggregate(dims)
+
+    assert list(table.index) == list(expected.index)
+    assert table.values == pytest.approx(expected.values)
+
+
+def test_rollup__unknown_dimension(tmp_path: Path) -> None:
+    db = SqliteLoanTape(tmp_path / "book.sqlite")
+    db.ingest(clean_loan_tape(generate_loan_tape(100)))
+
+    with pytest.raises(KeyError):
+        db.rollup(["Country", "Not a column"])
+
+
+def test_open_sqlite_tape__ingests_once(tmp_path: Path) -> None:
+    tape_path = tmp_path / "tape.csv"
+    generate_loan_tape(100).to_csv(tape_path, index=False)
+    db_path = tmp_path / "tape.sqlite"
+
+    db = open_sqlite_tape(tape_path, db_path)
+    assert db.source_matches(tape_path)
+    ingested_at = db_path.stat().st_mtime_ns
+
+    open_sqlite_tape(tape_path, db_path)
+    assert db_path.stat().st_mtime_ns == ingested_at
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from typing import Dict, List, Tuple
+
+from problem_c.aggregation import WEIGHT, WEIGHTED_MEAN, summarise_weighted
+from problem_c.cleaning import bucket_dtypes
+
+# TABLE MAPPING
+STRATIFICATIONS = [
+    "October Rating",
+    "Country",
+    "Status",
+    "Initial duration type",
+    "Annual rate bucket",
+]
+
+# Stratifications to show the capital weighted average annual return over
+WEIGHTED_AVERAGE_STRATIFICATIONS = [
+    ("Initial duration type", "October Rating"),
+]
+
+RATE = "Annual rate"
+CAPITAL = "Remaining capital"
+
+Dimensions = Tuple[str, ...]
+
+
+def table_dimensions() -> List[Dimensions]:
+    return [(strat,) for strat in STRATIFICATIONS] + list(
+        WEIGHTED_AVERAGE_STRATIFICATIONS
+    )
+
+
+def merge_sums(parts: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Add together partial sums over the same dimensions. The bucket columns are
+    put back to their ordered categoricals so they keep sorting in bin order
+    whatever order the parts arrived in. Missing keys are kept as they are
+    still part of the totals
+    """
+    dims = list(parts[0].index.names)
+    rows = pd.concat([part.reset_index() for part in parts], ignore_index=True)
+    for column, dtype in bucket_dtypes().items():
+        if column in dims:
+            rows[column] = rows[column].astype(dtype)
+
+    return rows.groupby(dims, observed=True, sort=True, dropna=False).sum()
+
+
+def stratification_tables(
+    sums: Dict[Dimensions, pd.DataFrame], total_capital: float
+) -> List[pd.DataFrame]:
+    """
+    Share of the total remaining capital for every single stratification,
+    followed by the capital weighted average annual return tables
+    """
+    tables = []
+    for strat in STRATIFICATIONS:
+        tables.append(
+            sums[(strat,)][[WEIGHT]].rename(columns={WEIGHT: CAPITAL})
+            / total_capital
+        )
+
+    for dims in WEIGHTED_AVERAGE_STRATIFICATIONS:
+        tables.append(
+            summarise_weighted(sums[dims])[[WEIGHTED_MEAN]].rename(
+                columns={WEIGHTED_MEAN: "Weighted Avg Annual Return"}
+            )
+        )
+
+    return tables
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from pathlib import Path
+from typing import Optional
+
+from problem_c.cleaning import bucket_loan_tape, clean_loan_tape
+from problem_c.cube import StratificationCube
+from problem_c.schema import LOAN_TAPE_SCHEMA
+
+# Only the columns the cleaning and stratification steps look at are read
+STREAM_COLUMNS = [
+    "October Rating",
+    "Annual rate",
+    "initial duration",
+    "Status",
+    "Remaining capital",
+    "Country",
+]
+
+DEFAULT_CHUNK_SIZE = 250_000
+
+
+def aggregate_csv(
+    path: Path, chunksize: Optional[int] = None
+) -> StratificationCube:
+    """
+    Stream a CSV loan tape in chunks, cleaning, bucketing and aggregating
+    each chunk into a cube before it is thrown away. Memory is bounded by the
+    chunk size and the number of stratification keys rather than the size of
+    the tape
+    """
+    if path.suffix != ".csv":
+        raise ValueError(
+            f"Streaming needs a CSV tape, {path.name} can only be loaded whole"
+        )
+
+    cube: Optional[StratificationCube] = None
+    with pd.read_csv(
+        path,
+        usecols=STREAM_COLUMNS,
+        dtype={column: LOAN_TAPE_SCHEMA[column] for column in STREAM_COLUMNS},
+        chunksize=chunksize or DEFAULT_CHUNK_SIZE,
+    ) as reader:
+        for chunk in reader:
+            chunk_cube = StratificationCube.from_frame(
+                bucket_loan_tape(clean_loan_tape(chunk))
+            )
+            cube = chunk_cube if cube is None else cube.merge(chunk_cube)
+
+    if cube is None:
+        raise ValueError(f"{path} has no loans in it")
+
+    return cube
@@ -0,0 +1,59 @@
+import random
+import pytest
+import pandas as pd
+
+from pathlib import Path
+
+from problem_c.cleaning import bucket_loan_tape, clean_loan_tape
+from problem_c.cube import StratificationCube
+from problem_c.streaming import aggregate_csv
+
+
+def _random_tape(rows: int) -> pd.DataFrame:
+    rng = random.Random(42)
+    return pd.DataFrame(
+        {
+            "October Rating": [
+                rng.choice(["A", "A ", "B+", " C"]) for _ in range(rows)
+            ],
+            "Annual rate": [
+                rng.choice([0.0, 0.045, 5.5, 0.08, 12.0]) for _ in range(rows)
+            ],
+            "initial duration": [rng.randint(1, 90) for _ in range(rows)],
+            "Status": [rng.choice(["Ongoing", "Loss"]) for _ in range(rows)],
+            "Remaining capital": [
+                rng.choice([0.0, 1_000.0, 2_500.5]) for _ in range(rows)
+            ],
+            "Country": [rng.choice(["fr", "it", "de"]) for _ in range(rows)],
+        }
+    )
+
+
+@pytest.mark.parametrize("chunksize", [(7), (50), (1_000)])
+def test_aggregate_csv__matches_in_memory(
+    tmp_path: Path, chunksize: int
+) -> None:
+    raw = _random_tape(200)
+    path = tmp_path / "tape.csv"
+    raw.to_csv(path, index=False)
+
+    expected = StratificationCube.from_frame(
+        bucket_loan_tape(clean_loan_tape(raw))
+    )
+    streamed = aggregate_csv(path, chunksize)
+
+    assert streamed.rows == 200
+    assert streamed.total_capital == pytest.approx(expected.total_capital)
+    for streamed_table, expected_table in zip(
+        streamed.tables(), expected.tables()
+    ):
+        assert list(streamed_table.index) == list(expected_table.index)
+        assert streamed_table.values == pytest.approx(expected_table.values)
+
+
+def test_aggregate_csv__not_csv(tmp_path: Path) -> None:
+    path = tmp_path / "tape.xlsx"
+    path.write_bytes(b"PK\x03\x04")
+
+    with pytest.raises(ValueError, match="CSV"):
+        aggregate_csv(path)
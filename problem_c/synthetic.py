@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from typing import Dict, Iterator
+
+# Shapes roughly follow the sample tape in problem_c/input/data.xlsx
+RATINGS = {
+    "B": 0.484,
+    "C": 0.221,
+    "B+": 0.133,
+    "C-": 0.111,
+    "A": 0.039,
+    "A+": 0.012,
+}
+STATUSES = {
+    "Ongoing": 0.7,
+    "Fully repaid": 0.157,
+    "Early Repayment": 0.061,
+    "In judicial procedure": 0.046,
+    "Late less than 120 days": 0.013,
+    "Late less than 30 days": 0.011,
+    "rescheduled": 0.007,
+    "Loss": 0.004,
+}
+COUNTRIES = {"fr": 0.443, "it": 0.389, "nl": 0.083, "es": 0.057, "de": 0.028}
+DURATIONS = {
+    48: 0.27,
+    60: 0.24,
+    36: 0.16,
+    24: 0.13,
+    12: 0.09,
+    72: 0.08,
+    84: 0.02,
+    6: 0.01,
+}
+REPAID_STATUSES = ("Fully repaid", "Early Repayment")
+
+# Share of ratings with stray whitespace and of rates typed in as percentages
+PADDED_RATING_SHARE = 0.79
+MISTYPED_RATE_SHARE = 0.01
+
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+
+def _choice(rng: np.random.Generator, weights: Dict, rows: int) -> np.ndarray:
+    values = list(weights.keys())
+    probabilities = np.array(list(weights.values()), dtype=float)
+    return np.array(values)[
+        rng.choice(len(values), rows, p=probabilities / probabilities.sum())
+    ]
+
+
+def generate_loan_tape(
+    rows: int, seed: int = 0, *, start: int = 0
+) -> pd.DataFrame:
+    """
+    A raw loan tape with the columns problem_c reads, including the stray
+    whitespace in ratings and the rates mistyped as percentages that the
+    cleaning stage has to deal with. The same seed and start always give the
+    same tape, start offsets the loan ids so chunks can be stitched together
+    """
+    rng = np.random.default_rng([seed, start])
+
+    ratings = _choice(rng, RATINGS, rows).astype(object)
+    padded = rng.random(rows) < PADDED_RATING_SHARE
+    ratings[padded] = ratings[padded] + " "
+
+    rates = np.round(rng.normal(0.055, 0.015, rows).clip(0.0, 0.099), 3)
+    mistyped = rng.random(rows) < MISTYPED_RATE_SHARE
+    rates[mistyped] = rates[mistyped] * 100
+
+    statuses = _choice(rng, STATUSES, rows)
+    capital = np.round(rng.lognormal(11.0, 1.3, rows).clip(0, 5_000_000), 2)
+    capital[np.isin(statuses, REPAID_STATUSES)] = 0.0
+
+    return pd.DataFrame(
+        {
+            "Loan id": [f"{idx:024x}" for idx in range(start, start + rows)],
+            "October Rating": ratings,
+            "Annual rate": rates,
+            "initial duration": _choice(rng, DURATIONS, rows),
+            "Status": statuses,
+            "Remaining capital": capital,
+            "Country": _choice(rng, COUNTRIES, rows),
+        }
+    )
+
+
+def generate_loan_tape_chunks(
+    rows: int, seed: int = 0, chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[pd.DataFrame]:
+    for start in range(0, rows, chunk_rows):
+        yield generate_loan_tape(
+            min(chunk_rows, rows - start), seed, start=start
+        )
+
+
+def write_loan_tape(
+    path: Path,
+    rows: int,
+    seed: int = 0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> None:
+    """
+    Write a synthetic tape to CSV a chunk at a time so tapes far bigger than
+    memory can be generated
+    """
+    for idx, chunk in enumerate(
+        generate_loan_tape_chunks(rows, seed, chunk_rows)
+    ):
+        chunk.to_csv(
+            path, index=False, mode="w" if idx == 0 else "a", header=idx == 0
+        )
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from pathlib import Path
+
+from problem_c.cleaning import COUNTRY_INITIALS_MAPPING, clean_loan_tape
+from problem_c.synthetic import generate_loan_tape, write_loan_tape
+
+
+def test_generate_loan_tape__seeded() -> None:
+    first = generate_loan_tape(1_000, seed=7)
+
+    pd.testing.assert_frame_equal(first, generate_loan_tape(1_000, seed=7))
+    assert not first.equals(generate_loan_tape(1_000, seed=8))
+    assert first["Loan id"].is_unique
+
+
+def test_generate_loan_tape__needs_cleaning() -> None:
+    df = generate_loan_tape(10_000)
+
+    assert set(df["Country"]) <= set(COUNTRY_INITIALS_MAPPING)
+    assert df["October Rating"].str.endswith(" ").any()
+    assert (df["Annual rate"] > 0.1).any()
+
+    cleaned = clean_loan_tape(df)
+    assert (cleaned["Annual rate"] <= 0.1).all()
+
+
+def test_write_loan_tape__chunked(tmp_path: Path) -> None:
+    path = tmp_path / "tape.csv"
+
+    write_loan_tape(path, 2_500, seed=3, chunk_rows=1_000)
+
+    df = pd.read_csv(path)
+    assert len(df.index) == 2_500
+    assert df["Loan id"].is_unique